@@ -134,6 +134,8 @@ class BTOOLS_PT_material_tools(bpy.types.Panel):
             row.alignment = "LEFT"
             row.prop(face_map_material, "auto_map", text="Auto")
             row.prop(face_map_material, "uv_mapping_method", text="")
+            if face_map_material.uv_mapping_method == "CUBE_PROJECTION":
+                col.prop(face_map_material, "texel_density")
 
             layout.label(text="Material")
             sp = layout.split(factor=0.8, align=True)
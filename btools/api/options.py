@@ -173,13 +173,20 @@ class GableRoofType(Enum):
     OPEN = 'OPEN'
     BOX = 'BOX'
 
+class HipRoofType(Enum):
+    FULL = 'FULL'
+    TRUNCATED = 'TRUNCATED'
+
 @dataclass
 class RoofOptions:
     type: RoofType = RoofType.HIP
     gable_type: GableRoofType = GableRoofType.OPEN
+    hip_type: HipRoofType = HipRoofType.FULL
     thickness: float = 0.1
     outset: float = 0.1
     height: float = 1.0
+    truncate: float = 1.0
+    simplify: float = 0.0
     add_border: bool = True 
     border: float = 0.1
 
@@ -20,6 +20,7 @@ from ..utils import (
     get_scaled_unit,
     get_bottom_faces,
     extrude_face_region,
+    track_faces,
 )
 
 
@@ -90,8 +91,8 @@ def create_arch(bm, top_edges, frame_faces, arch_prop, frame_thickness, xyz):
     """Create arch using top edges of extreme frames"""
     verts = sort_verts([v for e in top_edges for v in e.verts], xyz[0])
     arc_edges = [
-        bmesh.ops.connect_verts(bm, verts=[verts[0], verts[-1]])["edges"].pop(),
-        bmesh.ops.connect_verts(bm, verts=[verts[1], verts[-2]])["edges"].pop(),
+        track_faces(bmesh.ops.connect_verts)(bm, verts=[verts[0], verts[-1]])["edges"].pop(),
+        track_faces(bmesh.ops.connect_verts)(bm, verts=[verts[1], verts[-2]])["edges"].pop(),
     ]
 
     resolution, height, function = arch_prop.resolution, arch_prop.height, arch_prop.function
@@ -104,12 +105,12 @@ def create_arch(bm, top_edges, frame_faces, arch_prop, frame_thickness, xyz):
     arc_face = min(upper_arc[arch_prop.resolution // 2].link_faces, key=lambda f: f.calc_center_median().z)
     bmesh.ops.delete(bm, geom=[arc_face], context="FACES")
 
-    arch_frame_faces = bmesh.ops.bridge_loops(bm, edges=arc_edges)["faces"]
+    arch_frame_faces = track_faces(bmesh.ops.bridge_loops)(bm, edges=arc_edges)["faces"]
     arch_face = min(lower_arc[arch_prop.resolution // 2].link_faces, key=lambda f: f.calc_center_median().z)
 
     if len(verts) == 4:  # corner case
         verts = sort_verts([v for e in top_edges for v in e.verts], xyz[0])
-        new_edge = bmesh.ops.connect_verts(bm, verts=[verts[1], verts[-2]])['edges'].pop()
+        new_edge = track_faces(bmesh.ops.connect_verts)(bm, verts=[verts[1], verts[-2]])['edges'].pop()
         new_face = get_bottom_faces(new_edge.link_faces).pop()
         arch_frame_faces.append(new_face)
 
@@ -118,7 +119,7 @@ def create_arch(bm, top_edges, frame_faces, arch_prop, frame_thickness, xyz):
 
 @map_new_faces(FaceMap.DOOR_PANES)
 def pane_arch_face(bm, face, prop):
-    bmesh.ops.inset_individual(bm, faces=[face], thickness=prop.pane_margin * 0.75, use_even_offset=True)
+    track_faces(bmesh.ops.inset_individual)(bm, faces=[face], thickness=prop.pane_margin * 0.75, use_even_offset=True)
     bmesh.ops.translate(bm, verts=face.verts, vec=-face.normal * prop.pane_depth)
 
 
@@ -5,11 +5,12 @@ from ..facemap import (
     FaceMap,
     add_facemap_for_groups,
     verify_facemaps_for_object,
+    defer_facemap_updates,
 )
 
 from .balcony_types import create_balcony
 from .balcony_props import BalconyProperty
-from ...utils import get_edit_mesh, crash_safe
+from ...utils import get_edit_mesh, crash_safe, cache_face_analysis
 from ...utils import get_selected_face_dimensions
 
 
@@ -34,6 +35,8 @@ class BTOOLS_OT_add_balcony(bpy.types.Operator):
         self.props.draw(context, self.layout)
 
 @crash_safe
+@defer_facemap_updates
+@cache_face_analysis
 def build(context, prop):
     verify_facemaps_for_object(context.object)
     me = get_edit_mesh()
@@ -20,6 +20,7 @@ from ...utils import (
     calc_edge_median,
     get_selection_groups,
     calc_face_dimensions,
+    track_faces,
 )
 
 
@@ -42,12 +43,12 @@ def create_balcony_grouped(bm, faces, prop):
 
     for faces in selection_groups:
         [f.select_set(False) for f in faces]
-        group = filter_geom(bmesh.ops.duplicate(bm, geom=faces)['geom'], BMFace)
+        group = filter_geom(track_faces(bmesh.ops.duplicate)(bm, geom=faces)['geom'], BMFace)
         transform_grouped_faces(bm, group, prop)
         top_faces = extrude_balcony_grouped(bm, group, prop.depth)
 
         if prop.has_railing:
-            top_face = bmesh.ops.dissolve_faces(bm, faces=top_faces)['region'].pop()
+            top_face = track_faces(bmesh.ops.dissolve_faces)(bm, faces=top_faces)['region'].pop()
             add_railing_to_balcony_grouped(bm, top_face, prop)
 
 
@@ -71,7 +72,7 @@ def create_balcony_ungrouped(bm, faces, prop):
 
 
 def extrude_balcony(bm, face, depth, normal):
-    front = filter_geom(bmesh.ops.extrude_face_region(bm, geom=[face])["geom"], BMFace)[0]
+    front = filter_geom(track_faces(bmesh.ops.extrude_face_region)(bm, geom=[face])["geom"], BMFace)[0]
     map_balcony_faces(bm, front)
     bmesh.ops.translate(bm, verts=front.verts, vec=normal * depth)
 
@@ -94,9 +95,9 @@ def extrude_balcony_grouped(bm, group, depth):
     inset_faces = group[:]
     valid_normals = [f.normal.to_tuple(3) for f in group]
     for num in splitones(depth):
-        res = bmesh.ops.inset_region(
+        res = track_faces(bmesh.ops.inset_region)(
             bm, faces=inset_faces, depth=num, use_even_offset=True, use_boundary=True)["faces"]
-        bmesh.ops.dissolve_degenerate(
+        track_faces(bmesh.ops.dissolve_degenerate)(
             bm, dist=0.001, edges=list({e for f in inset_faces for e in f.edges}))
         inset_faces = validate(inset_faces)
         inset_faces.extend([f for f in res if f.normal.to_tuple(3) in valid_normals])
@@ -106,18 +107,18 @@ def extrude_balcony_grouped(bm, group, depth):
 
 def add_railing_to_balcony(bm, top, balcony_normal, prop):
     """Add railing to the balcony"""
-    ret = bmesh.ops.duplicate(bm, geom=[top])
+    ret = track_faces(bmesh.ops.duplicate)(bm, geom=[top])
     dup_top = filter_geom(ret["geom"], BMFace)[0]
 
     max_offset = min([*calc_face_dimensions(dup_top)]) / 2
     prop.rail.offset = clamp(prop.rail.offset, 0.0, max_offset - 0.001)
-    ret = bmesh.ops.inset_individual(
+    ret = track_faces(bmesh.ops.inset_individual)(
         bm, faces=[dup_top], thickness=prop.rail.offset, use_even_offset=True
     )
     bmesh.ops.delete(bm, geom=ret["faces"], context="FACES")
 
     edges = sort_edges(dup_top.edges, balcony_normal)[1:]
-    railing_geom = bmesh.ops.extrude_edge_only(bm, edges=edges)["geom"]
+    railing_geom = track_faces(bmesh.ops.extrude_edge_only)(bm, edges=edges)["geom"]
     bmesh.ops.translate(
         bm, verts=filter_geom(railing_geom, BMVert), vec=(0., 0., prop.rail.corner_post_height)
     )
@@ -132,17 +133,17 @@ def add_railing_to_balcony_grouped(bm, top, prop):
     """Create railing for grouped selection balcony"""
     old_boundary_edges = [e for e in top.edges if len(e.link_faces) > 1]
 
-    ret = bmesh.ops.duplicate(bm, geom=[top])
+    ret = track_faces(bmesh.ops.duplicate)(bm, geom=[top])
     boundary_edges = [ret['edge_map'][obe] for obe in old_boundary_edges]
     dup_top = filter_geom(ret["geom"], BMFace)[0]
 
     max_offset = min([*calc_face_dimensions(dup_top)]) / 2
     prop.rail.offset = clamp(prop.rail.offset, 0.0, max_offset - 0.001)
-    ret = bmesh.ops.inset_individual(bm, faces=[dup_top], thickness=prop.rail.offset, use_even_offset=True)
+    ret = track_faces(bmesh.ops.inset_individual)(bm, faces=[dup_top], thickness=prop.rail.offset, use_even_offset=True)
     bmesh.ops.delete(bm, geom=ret["faces"], context="FACES")
-    dup_edges = filter_geom(bmesh.ops.duplicate(bm, geom=boundary_edges)['geom'], BMEdge)
+    dup_edges = filter_geom(track_faces(bmesh.ops.duplicate)(bm, geom=boundary_edges)['geom'], BMEdge)
 
-    railing_geom = bmesh.ops.extrude_edge_only(bm, edges=dup_edges)["geom"]
+    railing_geom = track_faces(bmesh.ops.extrude_edge_only)(bm, edges=dup_edges)["geom"]
     bmesh.ops.translate(bm, verts=filter_geom(railing_geom, BMVert), vec=(0.0, 0.0, prop.rail.corner_post_height))
     bmesh.ops.delete(bm, geom=[dup_top], context="FACES")
     railing_faces = filter_geom(railing_geom, BMFace)
@@ -27,6 +27,9 @@ from ..utils import (
     subdivide_face_vertically,
     subdivide_face_horizontally,
     get_selected_face_dimensions,
+    remove_doubles_around,
+    log_new_faces,
+    cache_face_analysis,
 )
 from ..utils import VEC_UP, VEC_FORWARD
 from .array import ArrayProperty, ArrayGetSet
@@ -52,6 +55,7 @@ class CustomObjectProperty(bpy.types.PropertyGroup, SizeOffsetGetSet, ArrayGetSe
         layout.prop(self.array, "count")
 
 @crash_safe
+@cache_face_analysis
 def add_custom_execute(self, context):
     custom_obj = context.scene.btools_custom_object
     if not custom_obj:
@@ -120,6 +124,9 @@ def place_custom_object(context, prop, custom_obj):
     with bmesh_from_active_object(context) as bm:
         faces = [face for face in bm.faces if face.select]
 
+        # -- only weld the verts of the placed objects
+        verts = []
+
         for face in faces:
             face.select = False
             # No support for upward/downward facing
@@ -131,9 +138,9 @@ def place_custom_object(context, prop, custom_obj):
             for aface in array_faces:
                 # -- Create split and place obj
                 split_face = create_split(bm, aface, prop.size_offset.size, prop.size_offset.offset)
-                place_object_on_face(bm, split_face, custom_obj, prop)
+                verts.extend(place_object_on_face(bm, split_face, custom_obj, prop))
 
-        bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
+        remove_doubles_around(bm, verts, dist=0.0001)
 
 
 def transfer_materials(from_object, to_obj):
@@ -174,7 +181,7 @@ def duplicate_into_bm(bm, obj):
     """
     max_index = len(bm.faces)
     bm.from_mesh(obj.data.copy())
-    return [f for f in bm.faces if f.index >= max_index]
+    return log_new_faces([f for f in bm.faces if f.index >= max_index])
 
 
 # TODO(ranjian0) refactor function (duplicated from create_window_split)
@@ -192,7 +199,10 @@ def create_split(bm, face, size, offset):
 
 
 def place_object_on_face(bm, face, custom_obj, prop):
-    """Place the custom_object mesh flush on the face"""
+    """Place the custom_object mesh flush on the face
+
+    Return the verts of the placed mesh and of the face
+    """
     # XXX get mesh from custom_obj into bm
     face_idx = face.index
     custom_faces = duplicate_into_bm(bm, custom_obj)
@@ -210,7 +220,9 @@ def place_object_on_face(bm, face, custom_obj, prop):
     scale_to_size(bm, custom_verts, current_size, prop.size_offset.size, local_xyz(face))
 
     # cleanup
+    face_verts = list(face.verts)
     bmesh.ops.delete(bm, geom=[face], context="FACES_ONLY")
+    return custom_verts + face_verts
 
 
 def get_coplanar_faces(face_verts):
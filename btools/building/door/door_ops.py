@@ -3,14 +3,16 @@ import bmesh
 
 from ...utils import (
     crash_safe,
-    is_rectangle,
     get_edit_mesh,
+    analyze_faces,
+    cache_face_analysis,
 )
 
 from ..facemap import (
     FaceMap,
     add_facemap_for_groups,
     verify_facemaps_for_object,
+    defer_facemap_updates,
 )
 
 from .door_types import create_door
@@ -39,6 +41,8 @@ class BTOOLS_OT_add_door(bpy.types.Operator):
         self.props.draw(context, self.layout)
 
 @crash_safe
+@defer_facemap_updates
+@cache_face_analysis
 def build(context, props):
     verify_facemaps_for_object(context.object)
     me = get_edit_mesh()
@@ -64,5 +68,5 @@ def validate_door_faces(faces):
     # -- remove upward facing faces
     faces = list(filter(lambda f: abs(round(f.normal.z, 3)) == 0.0, faces))
     # -- remove non-rectangular faces
-    faces = list(filter(lambda f: is_rectangle(f), faces))
+    faces = [f for f, analysis in zip(faces, analyze_faces(faces)) if analysis.is_rectangle]
     return faces
@@ -34,32 +34,37 @@ from ...utils import (
     calc_face_dimensions,
     subdivide_face_vertically,
     subdivide_face_horizontally,
+    remove_doubles_around,
+    collect_new_faces,
 )
 
 
 def create_door(bm, faces, prop):
     """Create door from face selection"""
-    for face in faces:
-        face.select = False
-        if not valid_ngon(face):
-            ngon_to_quad(bm, face)
-
-        clamp_array_count(face, prop)
-        array_faces = subdivide_face_horizontally(bm, face, widths=[prop.width] * prop.count)
-        max_width = calc_face_dimensions(array_faces[0])[0]
-
-        split_edges = get_array_split_edges(array_faces)
-        split_faces = [create_door_split(bm, aface, prop) for aface in array_faces]
-        spread_array(bm, split_edges, split_faces, max_width, prop)
-
-        for face in split_faces:
-            door, arch = create_door_frame(bm, face, prop)
-            create_door_fill(bm, door, prop)
-            if prop.add_arch:
-                fill_arch(bm, arch, prop)
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
-
-    nulfaces = find_faces_without_facemap(bm)
+    with collect_new_faces() as created:
+        for face in faces:
+            face.select = False
+            if not valid_ngon(face):
+                ngon_to_quad(bm, face)
+
+            clamp_array_count(face, prop)
+            array_faces = subdivide_face_horizontally(bm, face, widths=[prop.width] * prop.count)
+            max_width = calc_face_dimensions(array_faces[0])[0]
+
+            split_edges = get_array_split_edges(array_faces)
+            split_faces = [create_door_split(bm, aface, prop) for aface in array_faces]
+            spread_array(bm, split_edges, split_faces, max_width, prop)
+
+            for face in split_faces:
+                door, arch = create_door_frame(bm, face, prop)
+                create_door_fill(bm, door, prop)
+                if prop.add_arch:
+                    fill_arch(bm, arch, prop)
+    created = validate(created)
+    # -- only weld the verts of the faces the build created
+    remove_doubles_around(bm, [v for f in created for v in f.verts], dist=0.0001)
+
+    nulfaces = find_faces_without_facemap(bm, validate(created + list(faces)))
     add_faces_to_map(bm, nulfaces, FaceMap.WALLS)
     return True
 
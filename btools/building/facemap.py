@@ -1,14 +1,18 @@
 import bpy
 import bmesh
+import warnings
+import numpy as np
 
 from enum import Enum, auto
 from functools import wraps
 
 from ..utils import (
+    validate,
     link_material,
     get_edit_mesh,
     bmesh_from_active_object,
-    uv_map_active_editmesh_selection,
+    uv_map_faces,
+    collect_new_faces,
 )
 
 
@@ -61,6 +65,9 @@ def map_new_faces(group, skip=None):
     """Finds all newly created faces in a function and adds them to a face_map
     called group.name.lower()
 
+    the faces are the ones the bmesh operators called through track_faces make,
+    or that are passed to log_new_faces, see collect_new_faces
+
     if skip is provided, then all faces in the face_map called skip.name
     will not be added to the face_map
     """
@@ -69,12 +76,14 @@ def map_new_faces(group, skip=None):
         @wraps(func)
         def wrapper(*args, **kwargs):
             bm = [arg for arg in args if isinstance(arg, bmesh.types.BMesh)].pop()
-            faces = set(bm.faces)
-
-            result = func(*args, **kwargs)
-
-            new_faces = set(bm.faces) - faces
-            add_faces_to_map(bm, list(new_faces), group, skip)
+            existing = set(bm.faces) if AUDIT_FACEMAPS else None
+            with collect_new_faces() as created:
+                result = func(*args, **kwargs)
+
+            faces = validate(created)
+            if AUDIT_FACEMAPS:
+                faces += audit_missed_faces(func.__name__, faces_created_since(bm, existing), faces)
+            add_faces_to_map(bm, faces, group, skip)
             return result
 
         return wrapper
@@ -82,6 +91,27 @@ def map_new_faces(group, skip=None):
     return outer
 
 
+# -- set to check the faces builds find against full scans of the mesh, for debugging
+AUDIT_FACEMAPS = False
+
+
+def faces_created_since(bm, faces):
+    """Faces in bm that are not in the snapshot faces, in the order bm iterates them
+
+    Only used by AUDIT_FACEMAPS, builds collect the faces they create, see collect_new_faces
+    """
+    return [f for f in bm.faces if f not in faces]
+
+
+def audit_missed_faces(name, expected, found):
+    """Warn about the faces in expected that are not in found, and return them"""
+    found = set(found)
+    missed = [f for f in expected if f not in found]
+    if missed:
+        warnings.warn("Facemap audit: {} missed {} faces".format(name, len(missed)), RuntimeWarning)
+    return missed
+
+
 def add_faces_to_map(bm, faces, group, skip=None):
     """Sets the face_map index of faces to the index of the face_map called
     group.name.lower()
@@ -91,28 +121,85 @@ def add_faces_to_map(bm, faces, group, skip=None):
     face_map = bm.faces.layers.face_map.active
     group_index = face_map_index_from_name(group.name.lower())
 
-    def remove_skipped(f):
-        if skip:
-            skip_index = face_map_index_from_name(skip.name.lower())
-            return not (f[face_map] == skip_index)
-        return True
+    if skip:
+        skip_index = face_map_index_from_name(skip.name.lower())
+        for face in faces:
+            if face[face_map] != skip_index:
+                face[face_map] = group_index
+    else:
+        for face in faces:
+            face[face_map] = group_index
+
+    if deferred_faces is not None:
+        deferred_faces.setdefault(bm, {}).update(dict.fromkeys(faces))
+    else:
+        update_facemap_materials(bm, faces)
 
-    for face in list(filter(remove_skipped, faces)):
-        face[face_map] = group_index
 
+# -- faces added to face maps while a build runs, see defer_facemap_updates
+deferred_faces = None
+
+
+def defer_facemap_updates(func):
+    """Decorator to UV map and assign materials to the faces that func adds to face maps
+    once, when func returns, instead of on every call to add_faces_to_map
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        global deferred_faces
+        if deferred_faces is not None:
+            # -- nested builds are flushed with the outermost one
+            return func(*args, **kwargs)
+
+        deferred_faces = {}
+        try:
+            result = func(*args, **kwargs)
+            pending = deferred_faces
+        finally:
+            deferred_faces = None
+
+        for bm, faces in pending.items():
+            update_facemap_materials(bm, list(faces))
+        if pending and bpy.context.mode == "EDIT_MESH":
+            bmesh.update_edit_mesh(bpy.context.edit_object.data, loop_triangles=True)
+        return result
+
+    return wrapper
+
+
+def update_facemap_materials(bm, faces):
+    """UV map faces and assign them the material of their face_map, one face_map at a time"""
     obj = bpy.context.object
+    face_map = bm.faces.layers.face_map.active
+    groups = {}
+    for face in validate(faces):
+        groups.setdefault(face[face_map], []).append(face)
+    groups = {idx: fs for idx, fs in groups.items() if 0 <= idx < len(obj.facemap_materials)}
 
     # -- if auto uv map is set, perform UV Mapping for given faces
-    if obj.facemap_materials[group_index].auto_map:
-        map_method = obj.facemap_materials[group_index].uv_mapping_method
-        uv_map_active_editmesh_selection(faces, map_method)
+    auto_map = [idx for idx in groups if obj.facemap_materials[idx].auto_map]
+    unwrap = [idx for idx in auto_map if obj.facemap_materials[idx].uv_mapping_method == "UNWRAP"]
+
+    # -- the unwrap operator maps the selection, so only select the faces of one face_map at a time
+    selected = [f for f in bm.faces if f.select] if unwrap else []
+    for f in selected:
+        f.select_set(False)
+
+    for idx in auto_map:
+        fmap_mat = obj.facemap_materials[idx]
+        uv_map_faces(bm, groups[idx], fmap_mat.uv_mapping_method, fmap_mat.texel_density)
+
+    for f in selected:
+        f.select_set(True)
 
     # -- if the facemap already has a material assigned, assign the new faces to the material
-    mat = obj.facemap_materials[group_index].material
-    mat_id = [idx for idx, m in enumerate(obj.data.materials) if m == mat]
-    if mat_id:
-        for f in faces:
-            f.material_index = mat_id[-1]
+    for idx, group_faces in groups.items():
+        mat = obj.facemap_materials[idx].material
+        mat_id = [i for i, m in enumerate(obj.data.materials) if m == mat]
+        if mat_id:
+            for f in group_faces:
+                f.material_index = mat_id[-1]
 
 
 def add_facemap_for_groups(groups):
@@ -126,6 +213,7 @@ def add_facemap_for_groups(groups):
         if not obj.face_maps.get(group.name.lower()):
             obj.face_maps.new(name=group.name.lower())
             obj.facemap_materials.add()
+            invalidate_face_map_indices(obj)
 
 
 def verify_facemaps_for_object(obj):
@@ -144,13 +232,7 @@ def set_material_for_active_facemap(material, context):
 
     link_material(obj, material)
     mat_id = [idx for idx, mat in enumerate(obj.data.materials) if mat == material].pop()
-
-    with bmesh_from_active_object(context) as bm:
-
-        face_map = bm.faces.layers.face_map.active
-        for face in bm.faces:
-            if face[face_map] == active_facemap.index:
-                face.material_index = mat_id
+    set_facemap_material_index(context, active_facemap.index, mat_id)
 
 
 def clear_material_for_active_facemap(context):
@@ -158,48 +240,93 @@ def clear_material_for_active_facemap(context):
     obj = context.object
     index = obj.face_maps.active_index
     active_facemap = obj.face_maps[index]
+    set_facemap_material_index(context, active_facemap.index, 0)
 
-    with bmesh_from_active_object(context) as bm:
 
+def set_facemap_material_index(context, facemap_index, mat_id):
+    """Set the material_index of all faces in the facemap at facemap_index to mat_id"""
+    obj = context.object
+    if context.mode == "OBJECT":
+        # -- read and write the whole mesh at once instead of going through bmesh
+        me = obj.data
+        material_indices = np.empty(len(me.polygons), dtype=np.int32)
+        me.polygons.foreach_get("material_index", material_indices)
+        material_indices[mesh_facemap_values(me) == facemap_index] = mat_id
+        me.polygons.foreach_set("material_index", material_indices)
+        me.update()
+        return
+
+    with bmesh_from_active_object(context) as bm:
         face_map = bm.faces.layers.face_map.active
         for face in bm.faces:
-            if face[face_map] == active_facemap.index:
-                face.material_index = 0
+            if face[face_map] == facemap_index:
+                face.material_index = mat_id
+
+
+def mesh_facemap_values(me):
+    """The facemap index of every polygon of me, -1 for those without one"""
+    values = np.full(len(me.polygons), -1, dtype=np.int32)
+    if len(me.face_maps):
+        me.face_maps[0].data.foreach_get("value", values)
+    return values
+
+
+# -- face_map name -> index of each object, keyed by the object's pointer
+face_map_indices = {}
 
 
 def face_map_index_from_name(name):
     """Get the index of a facemap from its name"""
-    for _, fmap in bpy.context.object.face_maps.items():
-        if fmap.name == name:
-            return fmap.index
-    return -1
+    obj = bpy.context.object
+    indices = face_map_indices.get(obj.as_pointer(), {})
+    index = indices.get(name, -1)
+
+    # XXX face maps can also be renamed, added or removed from the UI, so check the hit
+    face_maps = obj.face_maps
+    if not (0 <= index < len(face_maps) and face_maps[index].name == name):
+        indices = {fmap.name: fmap.index for fmap in face_maps}
+        face_map_indices[obj.as_pointer()] = indices
+        index = indices.get(name, -1)
+    return index
+
+
+def invalidate_face_map_indices(obj):
+    """Forget the face_map indices of obj, after its face maps have changed"""
+    face_map_indices.pop(obj.as_pointer(), None)
 
 
 def clear_empty_facemaps(context):
     """Remove all facemaps that don't have any faces assigned"""
     obj = context.object
-    with bmesh_from_active_object(context) as bm:
+    if context.mode == "OBJECT":
+        used_indices = set(np.unique(mesh_facemap_values(obj.data)).tolist())
+    else:
+        with bmesh_from_active_object(context) as bm:
+            face_map = bm.faces.layers.face_map.active
+            used_indices = {f[face_map] for f in bm.faces}
 
-        face_map = bm.faces.layers.face_map.active
-        used_indices = {f[face_map] for f in bm.faces}
-        all_indices = {f.index for f in obj.face_maps}
-        tag_remove_indices = all_indices - used_indices
+    all_indices = {f.index for f in obj.face_maps}
+    tag_remove_indices = all_indices - used_indices
+
+    # -- remove face maps
+    tag_remove_maps = [obj.face_maps[idx] for idx in tag_remove_indices]
+    for fmap in tag_remove_maps:
+        obj.face_maps.remove(fmap)
 
-        # -- remove face maps
-        tag_remove_maps = [obj.face_maps[idx] for idx in tag_remove_indices]
-        for fmap in tag_remove_maps:
-            obj.face_maps.remove(fmap)
+    # -- remove facemap materials:
+    for idx in sorted(tag_remove_indices, reverse=True):
+        obj.facemap_materials.remove(idx)
+    invalidate_face_map_indices(obj)
 
-        # -- remove facemap materials:
-        for idx in reversed(list(tag_remove_indices)):
-            obj.facemap_materials.remove(idx)
 
+def find_faces_without_facemap(bm, faces=None):
+    """Find the faces (all the faces in bm by default) that don't belong to any facemap
 
-def find_faces_without_facemap(bm):
-    """Find all the faces in bm that don't belong to any facemap"""
-    result = []
+    Builds pass the faces they created (see collect_new_faces) and the faces they edited.
+    With AUDIT_FACEMAPS set the rest of bm is checked as well, and faces missed are reported.
+    """
     face_map = bm.faces.layers.face_map.active
-    for f in bm.faces:
-        if f[face_map] < 0:
-            result.append(f)
+    result = [f for f in (bm.faces if faces is None else faces) if f[face_map] < 0]
+    if faces is not None and AUDIT_FACEMAPS:
+        result += audit_missed_faces("find_faces_without_facemap", [f for f in bm.faces if f[face_map] < 0], result)
     return result
\ No newline at end of file
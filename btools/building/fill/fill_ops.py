@@ -3,13 +3,14 @@ import bmesh
 
 from ...utils import (
     crash_safe,
-    is_rectangle,
     get_edit_mesh,
+    analyze_faces,
+    cache_face_analysis,
 )
 
 from .fill_types import add_fill
 from .fill_props import FillProperty
-from ..facemap import verify_facemaps_for_object
+from ..facemap import verify_facemaps_for_object, defer_facemap_updates
 
 
 class BTOOLS_OT_add_fill(bpy.types.Operator):
@@ -32,6 +33,8 @@ class BTOOLS_OT_add_fill(bpy.types.Operator):
         self.props.draw(context, self.layout)
 
 @crash_safe
+@defer_facemap_updates
+@cache_face_analysis
 def build(context, props):
     verify_facemaps_for_object(context.object)
     me = get_edit_mesh()
@@ -51,5 +54,5 @@ def validate_fill_faces(faces):
     # -- remove upward facing faces
     faces = list(filter(lambda f: abs(round(f.normal.z, 3)) == 0.0, faces))
     # -- remove non-rectangular faces
-    faces = list(filter(lambda f: is_rectangle(f), faces))
+    faces = [f for f, analysis in zip(faces, analyze_faces(faces)) if analysis.is_rectangle]
     return faces
@@ -22,6 +22,8 @@ from ...utils import (
     calc_face_dimensions,
     filter_vertical_edges,
     filter_horizontal_edges,
+    track_faces,
+    remove_doubles_around,
 )
 
 
@@ -115,14 +117,14 @@ def fill_panel(bm, face, prop):
     min_dimension = min(calc_face_dimensions(face))
     prop.panel_border_size = min(prop.panel_border_size, min_dimension / 2)
 
-    bmesh.ops.inset_individual(bm, faces=[face], thickness=prop.panel_border_size)
+    track_faces(bmesh.ops.inset_individual)(bm, faces=[face], thickness=prop.panel_border_size)
     quads = subdivide_face_into_quads(bm, face, prop.panel_count_x, prop.panel_count_y)
 
     # XXX Ensure panel margin is less that size of each quad)
     min_dimension = min(sum([calc_face_dimensions(q) for q in quads], ()))
     prop.panel_margin = min(prop.panel_margin, min_dimension / 2)
 
-    bmesh.ops.inset_individual(bm, faces=quads, thickness=prop.panel_margin, use_even_offset=True)
+    track_faces(bmesh.ops.inset_individual)(bm, faces=quads, thickness=prop.panel_margin, use_even_offset=True)
     bmesh.ops.translate(
         bm,
         verts=list({v for f in quads for v in f.verts}),
@@ -141,7 +143,7 @@ def fill_glass_panes(bm, face, prop, user=FillUser.DOOR):
         return
 
     userframe = FaceMap.DOOR_PANES if user == FillUser.DOOR else FaceMap.WINDOW_PANES
-    bmesh.ops.inset_individual(
+    track_faces(bmesh.ops.inset_individual)(
         bm, faces=[face], thickness=0.0001
     )  # to isolate the working quad and not leave adjacent face as n-gon
     quads = subdivide_face_into_quads(bm, face, prop.pane_count_x, prop.pane_count_y)
@@ -150,7 +152,7 @@ def fill_glass_panes(bm, face, prop, user=FillUser.DOOR):
     min_dimension = min(sum([calc_face_dimensions(q) for q in quads], ()))
     prop.pane_margin = min(prop.pane_margin, min_dimension / 2)
 
-    inset = map_new_faces(userframe)(bmesh.ops.inset_individual)
+    inset = map_new_faces(userframe)(track_faces(bmesh.ops.inset_individual))
     inset(bm, faces=quads, thickness=prop.pane_margin, depth=-prop.pane_depth, use_even_offset=True)
 
     usergroup = FaceMap.DOOR if user == FillUser.DOOR else FaceMap.WINDOW
@@ -198,7 +200,7 @@ def fill_louver(bm, face, prop, user=FillUser.DOOR):
     if prop.louver_margin:
         # XXX Louver margin should not exceed smallest face dimension
         prop.louver_margin = min(prop.louver_margin, min(calc_face_dimensions(face)) / 2)
-        inset = map_new_faces(FaceMap.FRAME)(bmesh.ops.inset_individual)
+        inset = map_new_faces(FaceMap.FRAME)(track_faces(bmesh.ops.inset_individual))
         inset(bm, faces=[face], thickness=prop.louver_margin)
 
     segments = double_and_make_even(prop.louver_count)
@@ -228,13 +230,13 @@ def subdivide_face_into_quads(bm, face, cuts_x, cuts_y):
 
     edges = []
     if cuts_x > 0:
-        res = bmesh.ops.subdivide_edges(bm, edges=v_edges, cuts=cuts_x)
+        res = track_faces(bmesh.ops.subdivide_edges)(bm, edges=v_edges, cuts=cuts_x)
         edges.extend(filter_geom(res["geom_inner"], BMEdge))
 
     if cuts_y > 0:
-        res = bmesh.ops.subdivide_edges(bm, edges=h_edges + edges, cuts=cuts_y)
+        res = track_faces(bmesh.ops.subdivide_edges)(bm, edges=h_edges + edges, cuts=cuts_y)
         edges.extend(filter_geom(res["geom_inner"], BMEdge))
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.01)
+    remove_doubles_around(bm, list(face.verts) + [v for e in edges for v in e.verts], dist=0.01)
     return list({f for ed in validate(edges) for f in ed.link_faces})
 
 
@@ -247,7 +249,7 @@ def create_bar_from_face(bm, face, trans, trans_space, depth, vertical=False):
 
 def duplicate_face_translate_scale(bm, face, trans, trans_space):
     """Duplicate a face and transform it"""
-    ret = bmesh.ops.duplicate(bm, geom=[face])
+    ret = track_faces(bmesh.ops.duplicate)(bm, geom=[face])
     verts = filter_geom(ret["geom"], BMVert)
     bmesh.ops.transform(bm, verts=verts, matrix=trans, space=trans_space)
     return ret
@@ -255,13 +257,13 @@ def duplicate_face_translate_scale(bm, face, trans, trans_space):
 
 def extrude_edges_to_depth(bm, edges, depth):
     """Extrude edges only and translate"""
-    ext = bmesh.ops.extrude_edge_only(bm, edges=edges)
+    ext = track_faces(bmesh.ops.extrude_edge_only)(bm, edges=edges)
     bmesh.ops.translate(bm, verts=filter_geom(ext["geom"], BMVert), vec=depth)
 
 
 def extrude_faces_add_slope(bm, faces, extrude_normal, extrude_depth):
     """Extrude faces and move top edge back to form a wedge"""
-    res = bmesh.ops.extrude_discrete_faces(bm, faces=faces)
+    res = track_faces(bmesh.ops.extrude_discrete_faces)(bm, faces=faces)
     bmesh.ops.translate(
         bm,
         vec=extrude_normal * extrude_depth,
@@ -278,7 +280,7 @@ def extrude_faces_add_slope(bm, faces, extrude_normal, extrude_depth):
 
 def subdivide_face_into_vertical_segments(bm, face, segments):
     """Cut a face(quad) vertically into multiple faces"""
-    res = bmesh.ops.subdivide_edges(bm, edges=filter_vertical_edges(face.edges), cuts=segments).get("geom_inner")
+    res = track_faces(bmesh.ops.subdivide_edges)(bm, edges=filter_vertical_edges(face.edges), cuts=segments).get("geom_inner")
     return list({f for e in filter_geom(res, BMEdge) for f in e.link_faces})
 
 
@@ -5,7 +5,8 @@ from ..facemap import (
     FaceMap, 
     clear_empty_facemaps,
     add_facemap_for_groups,
-    verify_facemaps_for_object
+    verify_facemaps_for_object,
+    defer_facemap_updates,
 )
 
 from ...utils import (
@@ -39,6 +40,7 @@ class BTOOLS_OT_add_floors(bpy.types.Operator):
 
 
 @crash_safe
+@defer_facemap_updates
 def build(context, prop):
     verify_facemaps_for_object(context.object)
 
@@ -10,6 +10,7 @@ from ...utils import (
     extrude_face_region,
     filter_vertical_edges,
     create_cube_without_faces,
+    track_faces,
 )
 
 
@@ -31,7 +32,7 @@ def extrude_slabs_and_floors(bm, faces, prop):
     normal = faces[0].normal.copy()
 
     if len(faces) > 1:
-        faces = bmesh.ops.dissolve_faces(bm, faces=faces)["region"]
+        faces = track_faces(bmesh.ops.dissolve_faces)(bm, faces=faces)["region"]
     create_columns(bm, faces[-1], prop)
 
     # extrude vertically
@@ -40,7 +41,7 @@ def extrude_slabs_and_floors(bm, faces, prop):
         for i, offset in enumerate(offsets):
             if i == 0:
                 orig_locs = [f.calc_center_bounds() for f in faces]
-                flat_faces = get_flat_faces(faces, {})
+                flat_faces = get_flat_faces(faces)
                 flat_faces, surrounding_faces = extrude_face_region(bm, flat_faces, offset, normal)
                 dissolve_flat_edges(bm, surrounding_faces)
                 surrounding_faces = filter_geom(
@@ -55,7 +56,7 @@ def extrude_slabs_and_floors(bm, faces, prop):
                 slabs += surrounding_faces
 
         # extrude slabs horizontally
-        slabs += bmesh.ops.inset_region(
+        slabs += track_faces(bmesh.ops.inset_region)(
             bm, faces=slabs, depth=prop.slab_outset, use_even_offset=True, use_boundary=True
         )["faces"]
 
@@ -80,21 +81,32 @@ def dissolve_flat_edges(bm, faces):
             if len(e.link_faces) > 1 and equal(e.calc_face_angle(), 0)
         }
     )
-    bmesh.ops.dissolve_edges(bm, edges=flat_edges, use_verts=True)
-
-
-def get_flat_faces(faces, visited):
-    flat_edges = list({
-        e for f in faces for e in f.edges
-        if len(e.link_faces) > 1 and equal(e.calc_face_angle(), 0)
-    })
-    flat_faces = []
-    for e in flat_edges:
-        for f in e.link_faces:
-            if not visited.get(f, False):
-                visited[f] = True
-                flat_faces += get_flat_faces([f], visited)
-    return list(set(faces + flat_faces))
+    track_faces(bmesh.ops.dissolve_edges)(bm, edges=flat_edges, use_verts=True)
+
+
+def get_flat_faces(faces):
+    """faces and all the faces connected to them through flat edges"""
+    flat_edges = {}
+
+    def is_flat(e):
+        if e not in flat_edges:
+            flat_edges[e] = len(e.link_faces) > 1 and equal(e.calc_face_angle(), 0)
+        return flat_edges[e]
+
+    flat_faces = list(dict.fromkeys(faces))
+    visited = set(flat_faces)
+    stack = list(flat_faces)
+    while stack:
+        face = stack.pop()
+        for e in face.edges:
+            if not is_flat(e):
+                continue
+            for f in e.link_faces:
+                if f not in visited:
+                    visited.add(f)
+                    flat_faces.append(f)
+                    stack.append(f)
+    return flat_faces
 
 
 def create_columns(bm, face, prop):
@@ -18,6 +18,7 @@ from ...utils import (
     sort_edges_clockwise,
     filter_vertical_edges,
     filter_horizontal_edges,
+    track_faces,
 )
 
 
@@ -53,7 +54,7 @@ def create_composite_floorplan(bm, prop):
     extrusion_lengths = [prop.tl1, prop.tl2, prop.tl3, prop.tl4]
     for idx, e in enumerate(edges):
         if extrusion_lengths[idx] > 0.0:
-            res = bmesh.ops.extrude_edge_only(bm, edges=[e])
+            res = track_faces(bmesh.ops.extrude_edge_only)(bm, edges=[e])
             verts = filter_geom(res["geom"], BMVert)
 
             direction = (calc_edge_median(e) - median_reference).normalized()
@@ -94,7 +95,7 @@ def create_hshaped_floorplan(bm, prop):
         length, width = extrusion_lengths[idx], extrusion_widths[idx]
 
         if length > 0.0:
-            res = bmesh.ops.extrude_edge_only(bm, edges=[edge])
+            res = track_faces(bmesh.ops.extrude_edge_only)(bm, edges=[edge])
             verts = filter_geom(res["geom"], BMVert)
             v = (calc_edge_median(edge) - median_reference).normalized()
             bmesh.ops.translate(bm, verts=verts, vec=Vector((0, math.copysign(1.0, v.y), 0)) * length)
@@ -115,7 +116,7 @@ def create_random_floorplan(bm, prop):
     random.seed(prop.seed)
     scale_x = Matrix.Scale(prop.width / 2, 4, (1, 0, 0))
     scale_y = Matrix.Scale(prop.length / 2, 4, (0, 1, 0))
-    bmesh.ops.create_grid(bm, x_segments=1, y_segments=1, size=1, matrix=scale_x @ scale_y)
+    track_faces(bmesh.ops.create_grid)(bm, x_segments=1, y_segments=1, size=1, matrix=scale_x @ scale_y)
 
     amount = prop.extension_amount
     if prop.random_extension_amount:
@@ -134,7 +135,7 @@ def create_random_floorplan(bm, prop):
 def extrude_left_and_right_edges(bm, median_reference):
     """Extrude the left and right edges of a plane"""
     for edge in filter_vertical_edges(bm.edges):
-        res = bmesh.ops.extrude_edge_only(bm, edges=[edge])
+        res = track_faces(bmesh.ops.extrude_edge_only)(bm, edges=[edge])
         verts = filter_geom(res["geom"], BMVert)
         bmesh.ops.translate(
             bm,
@@ -154,7 +155,7 @@ def determine_clockwise_extreme_edges_for_extrusion(bm):
 
 def subdivide_edge_twice_and_get_middle(bm, edge):
     """make two cuts to an edge and return middle edge"""
-    res = bmesh.ops.subdivide_edges(bm, edges=[edge], cuts=2)
+    res = track_faces(bmesh.ops.subdivide_edges)(bm, edges=[edge], cuts=2)
     new_verts = filter_geom(res["geom_inner"], BMVert)
     return (set(new_verts[0].link_edges) & set(new_verts[1].link_edges)).pop()
 
@@ -176,6 +177,6 @@ def random_scale_and_translate(bm, middle_edge):
 
 def random_extrude(bm, middle_edge, direction):
     """extrude an edge to a random size to make a plane"""
-    res = bmesh.ops.extrude_edge_only(bm, edges=[middle_edge])
+    res = track_faces(bmesh.ops.extrude_edge_only)(bm, edges=[middle_edge])
     extrude_length = (random.random() * middle_edge.calc_length()) + 1.0
     bmesh.ops.translate(bm, verts=filter_geom(res["geom"], BMVert), vec=direction * extrude_length)
@@ -2,6 +2,7 @@ import bpy
 from bpy.props import (
     BoolProperty,
     EnumProperty,
+    FloatProperty,
     PointerProperty,
     CollectionProperty,
 )
@@ -119,6 +120,13 @@ class FaceMapMaterial(bpy.types.PropertyGroup):
         description="How to perform UV Mapping",
     )
 
+    texel_density: FloatProperty(
+        name="Texel Density",
+        min=0.01,
+        default=2.0,
+        description="UV units per unit length for Cube_Projection",
+    )
+
 
 classes = (
     FaceMapMaterial,
@@ -4,13 +4,15 @@ import bmesh
 from ..facemap import (
     FaceMap,
     add_facemap_for_groups,
-    verify_facemaps_for_object
+    verify_facemaps_for_object,
+    defer_facemap_updates,
 )
 
 from ...utils import (
     crash_safe,
-    is_rectangle,
     get_edit_mesh,
+    analyze_faces,
+    cache_face_analysis,
 )
 
 from .multigroup_types import create_multigroup
@@ -41,6 +43,8 @@ class BTOOLS_OT_add_multigroup(bpy.types.Operator):
 
 
 @crash_safe
+@defer_facemap_updates
+@cache_face_analysis
 def build(context, props):
     verify_facemaps_for_object(context.object)
     me = get_edit_mesh()
@@ -66,5 +70,5 @@ def validate_multigroup_faces(faces):
     # -- remove upward facing faces
     faces = list(filter(lambda f: abs(round(f.normal.z, 3)) == 0.0, faces))
     # -- remove non-rectangular faces
-    faces = list(filter(lambda f: is_rectangle(f), faces))
+    faces = [f for f, analysis in zip(faces, analyze_faces(faces)) if analysis.is_rectangle]
     return faces
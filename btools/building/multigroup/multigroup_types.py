@@ -34,6 +34,8 @@ from ...utils import (
     filter_horizontal_edges,
     subdivide_face_horizontally,
     subdivide_face_vertically,
+    remove_doubles_around,
+    collect_new_faces,
 )
 
 # XXX small value to provide split margins
@@ -55,30 +57,33 @@ def create_multigroup(bm, faces, prop):
         popup_message("No valid components", "Components Error")
         return False
 
-    for face in faces:
-        face.select = False
-        if not valid_ngon(face):
-            ngon_to_quad(bm, face)
-
-        clamp_array_count(face, prop)
-        array_faces = subdivide_face_horizontally(bm, face, widths=[prop.width] * prop.count)
-        max_width = calc_face_dimensions(array_faces[0])[0]
-
-        split_edges = get_array_split_edges(array_faces)
-        split_faces = [create_multigroup_split(bm, aface, prop) for aface in array_faces]
-        spread_array(bm, split_edges, split_faces, max_width, prop)
-
-        for face in split_faces:
-            doors, windows, arch = create_multigroup_frame(bm, face, prop)
-            for door in doors:
-                fill_face(bm, door, prop, "DOOR")
-            for window in windows:
-                fill_face(bm, window, prop, "WINDOW")
-            if prop.add_arch:
-                fill_arch(bm, arch, prop)
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
-
-    nulfaces = find_faces_without_facemap(bm)
+    with collect_new_faces() as created:
+        for face in faces:
+            face.select = False
+            if not valid_ngon(face):
+                ngon_to_quad(bm, face)
+
+            clamp_array_count(face, prop)
+            array_faces = subdivide_face_horizontally(bm, face, widths=[prop.width] * prop.count)
+            max_width = calc_face_dimensions(array_faces[0])[0]
+
+            split_edges = get_array_split_edges(array_faces)
+            split_faces = [create_multigroup_split(bm, aface, prop) for aface in array_faces]
+            spread_array(bm, split_edges, split_faces, max_width, prop)
+
+            for face in split_faces:
+                doors, windows, arch = create_multigroup_frame(bm, face, prop)
+                for door in doors:
+                    fill_face(bm, door, prop, "DOOR")
+                for window in windows:
+                    fill_face(bm, window, prop, "WINDOW")
+                if prop.add_arch:
+                    fill_arch(bm, arch, prop)
+    created = validate(created)
+    # -- only weld the verts of the faces the build created
+    remove_doubles_around(bm, [v for f in created for v in f.verts], dist=0.0001)
+
+    nulfaces = find_faces_without_facemap(bm, validate(created + list(faces)))
     add_faces_to_map(bm, nulfaces, FaceMap.WALLS)
     return True
 
@@ -23,6 +23,7 @@ from ...utils import (
     edge_is_vertical,
     subdivide_edges,
     calc_verts_median,
+    track_faces,
 )
 
 RailingResult = namedtuple("RailingResult", "corner_posts top_rails fill")
@@ -45,7 +46,7 @@ def create_railing(bm, faces, prop, normal):
 def make_corner_posts(bm, edges, prop, up):
     posts = []
     for edge in edges:
-        ret = bmesh.ops.duplicate(bm, geom=[edge])
+        ret = track_faces(bmesh.ops.duplicate)(bm, geom=[edge])
         dup_edge = filter_geom(ret["geom"], BMEdge)[0]
         post = edge_to_cylinder(bm, dup_edge, prop.corner_post_width / 2, up, fill=True)
         posts.append(list({f for v in post for f in v.link_faces}))
@@ -54,7 +55,7 @@ def make_corner_posts(bm, edges, prop, up):
 
 def make_fill(bm, face, prop):
     # duplicate original face and resize
-    ret = bmesh.ops.duplicate(bm, geom=[face])
+    ret = track_faces(bmesh.ops.duplicate)(bm, geom=[face])
     dup_face = filter_geom(ret["geom"], BMFace)[0]
     non_vertical = [e for e in dup_face.edges if not edge_is_vertical(e)]
     top_edge = sort_edges(non_vertical, Vector((0.0, 0.0, -1.0)))[0]
@@ -103,7 +104,7 @@ def create_railing_bottom(bm, bot_edge, prop):
 
 
 def create_railing_cylinder(bm, edge, prop):
-    ret = bmesh.ops.duplicate(bm, geom=[edge])
+    ret = track_faces(bmesh.ops.duplicate)(bm, geom=[edge])
     top_dup_edge = filter_geom(ret["geom"], BMEdge)[0]
     vec = edge_vector(top_dup_edge)
 
@@ -136,7 +137,7 @@ def create_fill_posts(bm, face, prop):
     if n_posts != 0:
         inner_edges = subdivide_edges(bm, [top_edge, bottom_edge], dir, widths=[1.0] * (n_posts + 1))
         for edge in inner_edges:
-            ret = bmesh.ops.duplicate(bm, geom=[edge])
+            ret = track_faces(bmesh.ops.duplicate)(bm, geom=[edge])
             dup_edge = filter_geom(ret["geom"], BMEdge)[0]
             up = face.normal
             vec = edge_vector(dup_edge)
@@ -163,7 +164,7 @@ def create_fill_rails(bm, face, prop):
     if n_rails != 0:
         inner_edges = subdivide_edges(bm, vertical_edges, Vector((0.0, 0.0, 1.0)), widths=[1.0] * (n_rails + 1))
         for edge in inner_edges:
-            ret = bmesh.ops.duplicate(bm, geom=[edge])
+            ret = track_faces(bmesh.ops.duplicate)(bm, geom=[edge])
             dup_edge = filter_geom(ret["geom"], BMEdge)[0]
             up = face.normal
 
@@ -188,13 +189,13 @@ def create_fill_walls(bm, face, prop):
     # create walls
     wall_size = clamp(prop.wall_fill.width, 0.001, prop.corner_post_width)
 
-    ret = bmesh.ops.duplicate(bm, geom=[face])
+    ret = track_faces(bmesh.ops.duplicate)(bm, geom=[face])
     dup_face = filter_geom(ret["geom"], BMFace)[0]
     bmesh.ops.translate(bm, verts=dup_face.verts, vec=-face.normal * wall_size / 2)
-    ret = bmesh.ops.extrude_edge_only(bm, edges=dup_face.edges)
+    ret = track_faces(bmesh.ops.extrude_edge_only)(bm, edges=dup_face.edges)
     verts = filter_geom(ret["geom"], BMVert)
     bmesh.ops.translate(bm, verts=verts, vec=face.normal * wall_size)
-    f = bmesh.ops.contextual_create(bm, geom=verts).get("faces")
+    f = track_faces(bmesh.ops.contextual_create)(bm, geom=verts).get("faces")
 
     # delete reference faces and hidden faces
     bmesh.ops.delete(bm, geom=[face] + filter_geom(ret["geom"], BMFace), context="FACES")
@@ -212,7 +213,7 @@ def edge_to_cylinder(bm, edge, radius, up, n=4, fill=False):
     all_verts = [v for v in edge.verts]
     dir.rotate(Quaternion(edge_vec, math.pi - theta / 2).to_euler())
     for i in range(0, n):
-        ret = bmesh.ops.extrude_edge_only(bm, edges=[edge])
+        ret = track_faces(bmesh.ops.extrude_edge_only)(bm, edges=[edge])
         edge = filter_geom(ret["geom"], BMEdge)[0]
         bmesh.ops.translate(bm, verts=edge.verts, vec=dir * length)
         dir.rotate(Quaternion(edge_vec, math.radians(360 / n)).to_euler())
@@ -225,8 +226,8 @@ def edge_to_cylinder(bm, edge, radius, up, n=4, fill=False):
         sorted_edges = sort_edges({e for v in valid_verts for e in v.link_edges}, edge_vec)
         top_edges = sorted_edges[-n:]
         bottom_edges = sorted_edges[:n]
-        bmesh.ops.holes_fill(bm, edges=top_edges)
-        bmesh.ops.holes_fill(bm, edges=bottom_edges)
+        track_faces(bmesh.ops.holes_fill)(bm, edges=top_edges)
+        track_faces(bmesh.ops.holes_fill)(bm, edges=bottom_edges)
 
     return validate(all_verts)
 
@@ -9,6 +9,7 @@ from ..utils import (
     sort_faces,
     sort_verts,
     get_edit_mesh,
+    track_faces,
 )
 
 
@@ -20,8 +21,8 @@ def remove(context):
     cornerv, midv = get_bounding_verts(bound_faces)
 
     bmesh.ops.delete(bm, geom=bound_faces, context="FACES")
-    bmesh.ops.dissolve_verts(bm, verts=midv)
-    newfaces = bmesh.ops.contextual_create(bm, geom=cornerv).get('faces')
+    track_faces(bmesh.ops.dissolve_verts)(bm, verts=midv)
+    newfaces = track_faces(bmesh.ops.contextual_create)(bm, geom=cornerv).get('faces')
     add_faces_to_map(bm, newfaces, FaceMap.WALLS)
 
     bmesh.update_edit_mesh(me, loop_triangles=True)
@@ -5,7 +5,8 @@ from ...utils import crash_safe, get_edit_mesh
 from ..facemap import (
     FaceMap,
     add_facemap_for_groups,
-    verify_facemaps_for_object
+    verify_facemaps_for_object,
+    defer_facemap_updates,
 )
 
 from .roof_types import create_roof
@@ -26,14 +27,15 @@ class BTOOLS_OT_add_roof(bpy.types.Operator):
         return context.object is not None and context.mode == "EDIT_MESH"
 
     def execute(self, context):
-        return build(context, self.props)
+        return build(context, self.props, self.report)
 
     def draw(self, context):
         self.props.draw(context, self.layout)
 
 
 @crash_safe
-def build(context, props):
+@defer_facemap_updates
+def build(context, props, report=None):
     verify_facemaps_for_object(context.object)
     me = get_edit_mesh()
     bm = bmesh.from_edit_mesh(me)
@@ -46,7 +48,9 @@ def build(context, props):
 
     if validate_roof_faces(bm):
         add_roof_facemaps()
-        create_roof(bm, faces, props)
+        removed = create_roof(bm, faces, props)
+        if removed and report:
+            report({"INFO"}, "Simplify removed {} footprint vertices".format(removed))
         bmesh.update_edit_mesh(me, loop_triangles=True)
         return {"FINISHED"}
 
@@ -26,6 +26,17 @@ class RoofProperty(bpy.types.PropertyGroup):
         description="Type of gable roof to create",
     )
 
+    hip_types = [
+        ("FULL", "Full", "", 0),
+        ("TRUNCATED", "Truncated", "", 1),
+    ]
+    hip_type: EnumProperty(
+        name="Hip Type",
+        items=hip_types,
+        default="FULL",
+        description="Type of hip roof to create",
+    )
+
     thickness: FloatProperty(
         name="Thickness",
         min=get_scaled_unit(0.01),
@@ -53,6 +64,24 @@ class RoofProperty(bpy.types.PropertyGroup):
         description="Height of entire roof",
     )
 
+    truncate: FloatProperty(
+        name="Truncate",
+        min=get_scaled_unit(0.01),
+        max=get_scaled_unit(10.0),
+        default=get_scaled_unit(1),
+        unit="LENGTH",
+        description="Inset from the roof edge to the flat top of a truncated hip roof",
+    )
+
+    simplify: FloatProperty(
+        name="Simplify",
+        min=0.0,
+        max=get_scaled_unit(1.0),
+        default=0.0,
+        unit="LENGTH",
+        description="Distance within which nearly duplicate and nearly collinear footprint vertices are removed, 0 keeps them all",
+    )
+
     add_border: BoolProperty(
         name="Add Border",
         default=True,
@@ -89,9 +118,16 @@ class RoofProperty(bpy.types.PropertyGroup):
             col.prop(self, "thickness")
             col.prop(self, "outset")
             col.prop(self, "height")
+            col.prop(self, "simplify")
 
         else:
+            row = box.row(align=True)
+            row.prop(self, "hip_type", expand=True)
+
             col = box.column(align=True)
             col.prop(self, "thickness")
             col.prop(self, "outset")
             col.prop(self, "height")
+            if self.hip_type == "TRUNCATED":
+                col.prop(self, "truncate")
+            col.prop(self, "simplify")
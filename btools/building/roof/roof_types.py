@@ -1,6 +1,8 @@
+import bpy
+import math
 import bmesh
+import multiprocessing
 import mathutils
-import numpy as np
 from bmesh.types import BMVert, BMFace
 from mathutils import Vector
 
@@ -14,26 +16,33 @@ from ...utils import (
     equal,
     select,
     validate,
-    edge_vector,
-    skeletonize,
+    iter_skeleton,
+    Skeleton,
+    skeleton_cache,
+    simplify_polygon,
+    get_selection_groups,
     filter_geom,
     popup_message,
     edge_is_vertical,
     calc_edge_median,
+    track_faces,
+    log_new_faces,
 )
 
 
 def create_roof(bm, faces, prop):
-    """Create roof types"""
+    """Create roof types, return the number of footprint verts removed by simplification"""
+    groups = get_selection_groups(bm)
     select(faces, False)
     if prop.type == "FLAT":
         create_flat_roof(bm, faces, prop)
     elif prop.type == "GABLE":
         add_facemap_for_groups(FaceMap.ROOF_HANGS)
-        create_gable_roof(bm, faces, prop)
+        return create_gable_roof(bm, groups, prop)
     elif prop.type == "HIP":
         add_facemap_for_groups(FaceMap.ROOF_HANGS)
-        create_hip_roof(bm, faces, prop)
+        return create_hip_roof(bm, groups, prop)
+    return 0
 
 
 @map_new_faces(FaceMap.ROOF)
@@ -45,96 +54,166 @@ def create_flat_roof(bm, faces, prop):
     # -- add border
     if prop.add_border:
         # -- inset top face
-        bmesh.ops.inset_region(bm, faces=top_face, thickness=prop.border, use_even_offset=True)
+        track_faces(bmesh.ops.inset_region)(bm, faces=top_face, thickness=prop.border, use_even_offset=True)
 
         # -- extrude downwards
-        ret = bmesh.ops.extrude_face_region(bm, geom=top_face).get("geom")
+        ret = track_faces(bmesh.ops.extrude_face_region)(bm, geom=top_face).get("geom")
         bmesh.ops.translate(bm, vec=(0, 0, -(prop.thickness - 0.0011)), verts=filter_geom(ret, BMVert))
         bmesh.ops.delete(bm, geom=top_face, context="FACES")
 
 
-def create_gable_roof(bm, faces, prop):
-    """Create gable roof"""
+def create_gable_roof(bm, groups, prop):
+    """Create a gable roof on each group of adjacent faces, return the number of verts simplified away"""
+    footprints = []
+    removed = 0
+    for faces in groups:
+        faces, count = gable_roof_footprint(bm, faces, prop)
+        footprints.append(faces)
+        removed += count
+
+    # -- compute straight skeletons
+    polygons = [footprint_points(faces[-1]) for faces in footprints]
+    skeletons = compute_skeletons(polygons, zero_gradient=True)
+
+    for faces, skeleton in zip(footprints, skeletons):
+        face = faces[-1]
+        median = face.calc_center_median()
+        original_edges = validate(face.edges)
+        bmesh.ops.delete(bm, geom=faces, context="FACES_ONLY")
+
+        height_scale = prop.height / max([arc.height for arc in skeleton.subtrees])
+
+        # -- create faces
+        roof_faces = create_skeleton_faces(bm, skeleton, original_edges, median, height_scale)
+        if prop.gable_type == "OPEN":
+            gable_process_open(bm, roof_faces, prop)
+        elif prop.gable_type == "BOX":
+            gable_process_box(bm, roof_faces, prop)
+    return removed
+
+
+def gable_roof_footprint(bm, faces, prop):
+    """Create the base of a gable roof
+
+    Returns the faces, the last of which is the footprint, and the number of verts simplified away
+    """
     # -- create initial outset for box gable roof
     if prop.gable_type == "BOX":
         faces = extrude_and_outset(bm, faces, prop.thickness, prop.outset)
         link_faces = {f for fa in faces for e in fa.edges for f in e.link_faces}
         all_edges = {e for f in link_faces for e in f.edges}
         bmesh.ops.delete(bm, geom=list(link_faces), context="FACES")
-        faces = bmesh.ops.contextual_create(bm, geom=validate(all_edges)).get("faces")
+        faces = track_faces(bmesh.ops.contextual_create)(bm, geom=validate(all_edges)).get("faces")
 
         bot_faces = [f for e in faces[-1].edges for f in e.link_faces if f not in faces]
         add_faces_to_map(bm, bot_faces, FaceMap.ROOF_HANGS)
     else:
         # -- Open GABLE
         #  XXX prevent dissolve_lone_verts from destroying lower geometry
-        ret = bmesh.ops.extrude_face_region(bm, geom=faces).get("geom")
+        ret = track_faces(bmesh.ops.extrude_face_region)(bm, geom=faces).get("geom")
         bmesh.ops.translate(bm, vec=(0, 0, 0.0011), verts=filter_geom(ret, BMVert))
         bmesh.ops.delete(bm, geom=faces, context="FACES")
         faces = filter_geom(ret, BMFace)
 
     # -- dissolve if faces are many
     if len(faces) > 1:
-        faces = bmesh.ops.dissolve_faces(bm, faces=faces, use_verts=True).get("region")
+        faces = track_faces(bmesh.ops.dissolve_faces)(bm, faces=faces, use_verts=True).get("region")
     face = faces[-1]
-    median = face.calc_center_median()
 
     # -- remove verts that are between two parallel edges
     dissolve_lone_verts(bm, face, list(face.edges))
-    original_edges = validate(face.edges)
+    return faces, simplify_footprint(bm, face, prop.simplify)
 
-    # -- get verts in anti-clockwise order (required by straight skeleton)
-    verts = [v for v in sort_verts_by_loops(face)]
-    points = [v.co.to_tuple()[:2] for v in verts]
 
-    # -- compute straight skeleton
-    skeleton = skeletonize(points, [], zero_gradient=True)
-    bmesh.ops.delete(bm, geom=faces, context="FACES_ONLY")
+def create_hip_roof(bm, groups, prop):
+    """Create a hip roof on each group of adjacent faces, return the number of verts simplified away"""
+    # -- create base for hip roof
+    roof_hang = map_new_faces(FaceMap.ROOF_HANGS)(extrude_and_outset)
+    footprints = []
+    removed = 0
+    for faces in groups:
+        faces = roof_hang(bm, faces, prop.thickness, prop.outset)
+        face = faces[-1]
+
+        # -- remove verts that are between two parallel edges
+        dissolve_lone_verts(bm, face, list(face.edges))
+        removed += simplify_footprint(bm, face, prop.simplify)
+        footprints.append(faces)
+
+    # -- compute straight skeletons
+    polygons = [footprint_points(faces[-1]) for faces in footprints]
+    if prop.hip_type == "TRUNCATED":
+        # -- only compute the skeleton up to the flat top
+        skeletons = compute_skeletons(polygons, max_height=prop.truncate)
+    else:
+        skeletons = compute_skeletons(polygons)
 
-    height_scale = prop.height / max([arc.height for arc in skeleton])
+    for faces, skeleton in zip(footprints, skeletons):
+        face = faces[-1]
+        median = face.calc_center_median()
+        original_edges = validate(face.edges)
+        if prop.hip_type == "TRUNCATED":
+            height_scale = prop.height / prop.truncate
+        else:
+            height_scale = prop.height / max([arc.height for arc in skeleton.subtrees])
+        bmesh.ops.delete(bm, geom=faces, context="FACES_ONLY")
 
-    # -- create edges and vertices
-    skeleton_edges = create_skeleton_verts_and_edges(
-        bm, skeleton, original_edges, median, height_scale
-    )
+        # -- create faces, with the flat top if there is one
+        create_skeleton_faces(bm, skeleton, original_edges, median, height_scale)
+    return removed
 
-    # -- create faces
-    roof_faces = create_skeleton_faces(bm, original_edges, skeleton_edges)
-    if prop.gable_type == "OPEN":
-        gable_process_open(bm, roof_faces, prop)
-    elif prop.gable_type == "BOX":
-        gable_process_box(bm, roof_faces, prop)
 
+def footprint_points(face):
+    """2D points of face in the (clockwise) order required by the straight skeleton"""
+    return [v.co.to_tuple()[:2] for v in sort_verts_by_loops(face)]
 
-def create_hip_roof(bm, faces, prop):
-    """Create a hip roof"""
-    # -- create base for hip roof
-    roof_hang = map_new_faces(FaceMap.ROOF_HANGS)(extrude_and_outset)
-    faces = roof_hang(bm, faces, prop.thickness, prop.outset)
-    face = faces[-1]
-    median = face.calc_center_median()
 
-    # -- remove verts that are between two parallel edges
-    dissolve_lone_verts(bm, face, list(face.edges))
-    original_edges = validate(face.edges)
+# -- footprints with at least this many verts in total are skeletonized in worker processes
+PARALLEL_SKELETON_VERTS = 5000
+
 
-    # -- get verts in anti-clockwise order
-    verts = [v for v in sort_verts_by_loops(face)]
-    points = [v.co.to_tuple()[:2] for v in verts]
+def compute_skeletons(polygons, zero_gradient=False, max_height=None, parallel=None):
+    """Compute the straight skeletons of polygons, one after the other unless parallel
 
-    # -- compute straight skeleton
-    skeleton = skeletonize(points, [])
-    bmesh.ops.delete(bm, geom=faces, context="FACES_ONLY")
+    Parallel defaults to whether the polygons have PARALLEL_SKELETON_VERTS verts in total,
+    since starting worker processes costs more than skeletonizing small footprints.
+    Returns a list of Skeletons (see skeletonize_faces), in the same order as polygons
+    """
+    if parallel is None:
+        parallel = sum(len(p) for p in polygons) >= PARALLEL_SKELETON_VERTS
+    if not parallel or len(polygons) == 1:
+        return [compute_skeleton(p, zero_gradient, max_height) for p in polygons]
+
+    # -- spawn works on every platform, the workers only import util_skeleton and never bpy
+    return skeleton_cache.skeletonize_many(
+        polygons, zero_gradient, max_height, mp_context=multiprocessing.get_context("spawn")
+    )
 
-    height_scale = prop.height / max([arc.height for arc in skeleton])
 
-    # -- create edges and vertices
-    skeleton_edges = create_skeleton_verts_and_edges(
-        bm, skeleton, original_edges, median, height_scale
+def compute_skeleton(points, zero_gradient=False, max_height=None):
+    """Compute the straight skeleton of points, reusing the skeletons of congruent footprints"""
+    return skeleton_cache.skeletonize(
+        points, [], zero_gradient, max_height, solve=skeletonize_with_progress
     )
 
-    # -- create faces
-    create_skeleton_faces(bm, original_edges, skeleton_edges)
+
+def skeletonize_with_progress(polygon, holes=None, zero_gradient=False, max_height=None):
+    """Same as skeletonize_faces, reporting progress to the window manager"""
+    wm = bpy.context.window_manager
+    skeleton = []
+    subtrees = iter_skeleton(polygon, holes, zero_gradient, max_height, faces=True)
+
+    # -- each event resolves about one vertex, so the vertex count bounds the progress
+    wm.progress_begin(0, len(polygon))
+    try:
+        while True:
+            skeleton.append(next(subtrees))
+            wm.progress_update(min(len(skeleton), len(polygon)))
+    except StopIteration as stop:
+        contours, faces = stop.value
+    finally:
+        wm.progress_end()
+    return Skeleton(skeleton, contours, faces)
 
 
 def sort_verts_by_loops(face):
@@ -150,162 +229,144 @@ def sort_verts_by_loops(face):
     return verts
 
 
-def vert_at_loc(loc, verts, loc_z=None):
-    """Find all verts at loc(x,y), return the one with highest z coord"""
-    results = []
-    for vert in verts:
-        co = vert.co
-        if equal(co.x, loc.x) and equal(co.y, loc.y):
-            if loc_z:
-                if equal(co.z, loc_z):
-                    results.append(vert)
-            else:
-                results.append(vert)
-
-    if results:
-        return max([v for v in results], key=lambda v: v.co.z)
-    return None
-
-
-def create_skeleton_verts_and_edges(bm, skeleton, original_edges, median, height_scale):
-    """Create the vertices and edges from output of straight skeleton"""
-    skeleton_edges = []
-    skeleton_verts = []
-    O_verts = list({v for e in original_edges for v in e.verts})
-    for arc in skeleton:
-        source = arc.source
-        vsource = vert_at_loc(source, O_verts + skeleton_verts)
-        if not vsource:
-            source_height = [arc.height for arc in skeleton if arc.source == source]
-            ht = source_height.pop() * height_scale
-            vsource = make_vert(bm, Vector((source.x, source.y, median.z + ht)))
-            skeleton_verts.append(vsource)
-
-        for sink in arc.sinks:
-            vs = vert_at_loc(sink, O_verts + skeleton_verts)
-            if not vs:
-                sink_height = min([arc.height for arc in skeleton if sink in arc.sinks])
-                ht = height_scale * sink_height
-                vs = make_vert(bm, Vector((sink.x, sink.y, median.z + ht)))
-            skeleton_verts.append(vs)
-
-            # create edge
-            if vs != vsource:
-                geom = bmesh.ops.contextual_create(bm, geom=[vsource, vs]).get("edges")
-                skeleton_edges.extend(geom)
+@map_new_faces(FaceMap.ROOF)
+def create_skeleton_faces(bm, skeleton, original_edges, median, height_scale):
+    """Create the roof faces of skeleton, and the flat top inside its contours, in one batch
 
-    skeleton_edges = validate(skeleton_edges)
-    S_verts = list({v for e in skeleton_edges for v in e.verts} - set(O_verts))
-    return join_intersections_and_get_skeleton_edges(bm, S_verts, skeleton_edges)
+    The points of all the face rings are merged into a single list of locations first, so
+    every new vert is made with one bm.verts.new and every face with one bm.faces.new
+    """
+    original_verts = list({v for e in original_edges for v in e.verts})
+    heights = skeleton_heights(skeleton.subtrees)
+    top = max(heights.values(), default=0)
 
+    def location(point):
+        return Vector((point.x, point.y, median.z + height_scale * heights.get(point, top)))
 
-@map_new_faces(FaceMap.ROOF)
-def create_skeleton_faces(bm, original_edges, skeleton_edges):
-    """Create faces formed from hiproof verts and edges"""
+    if any(len(ring) < 3 for ring in skeleton.faces):
+        # -- _face_ring leaves the faces it could not close open, see the console for which
+        popup_message("Some roof faces could not be built from the skeleton", title="Geometry Error")
 
-    def interior_angle(vert, e1, e2):
-        """Determine anti-clockwise interior angle between edges
-        https://stackoverflow.com/questions/2827393/angles-between-two-n-dimensional-vectors-in-python
-        """
-        # XXX Order of vector creation is really important
-        v1 = vert.co - e1.other_vert(vert).co
-        v2 = e2.other_vert(vert).co - vert.co
-        return np.math.atan2(np.linalg.det([v1.xy, v2.xy]), np.dot(v1.xy, v2.xy))
-
-    def boundary_walk(e, reverse=False):
-        """Perform boundary walk using least interior angle"""
-        v, last = e.verts
-        if reverse:
-            last, v = e.verts
-
-        previous = e
-        found_edges = [e]
-        while v != last:
-            linked = [e for e in v.link_edges if e in skeleton_edges and e not in found_edges]
-            if not linked:
-                common_edge = set(v.link_edges) & set(last.link_edges)
-                if common_edge:
-                    found_edges.append(common_edge.pop())
-                    break
-                # Re-walk if we have not reversed already, otherwise fail quietly
-                return boundary_walk(e, True) if not reverse else []
-
-            next_edge = linked[0]
-            if len(linked) > 1:
-                next_edge = min(linked, key=lambda e: interior_angle(v, previous, e))
-            previous = next_edge
-            found_edges.append(next_edge)
-            v = next_edge.other_vert(v)
-
-        return found_edges
+    points = RoofPoints([v.co for v in original_verts], location)
+    rings = [points.ring(ring) for ring in skeleton.faces + skeleton.contours]
+    rings = points.split_sides([ring for ring in rings if len(ring) > 2])
 
+    verts = original_verts + [bm.verts.new(co) for co in points.locations[len(original_verts):]]
     result = []
-    for ed in validate(original_edges):
-        walk = boundary_walk(ed)
-        if len(walk) < 3:
+    for ring in rings:
+        try:
+            # -- rings wind the same way as the footprint points, so opposite to the roof faces
+            face = bm.faces.new([verts[i] for i in reversed(ring)])
+        except ValueError:
             # XXX Geometry error caused by intersecting roof edges
             # esp when outset property is set high on concave polygons
 
             # -- try to help user
             popup_message("Roof Intersection Detected. Adjust(decrease) roof 'outset'", title="Geometry Error")
             continue
-        result.extend(bmesh.ops.contextual_create(bm, geom=walk).get("faces"))
-    return result
-
-
-def make_vert(bm, location):
-    """Create a vertex at location"""
-    return bmesh.ops.create_vert(bm, co=location).get("vert").pop()
-
-
-def join_intersecting_verts_and_edges(bm, edges, verts):
-    """Find all vertices that intersect/ lie at an edge and merge
-    them to that edge
-    """
-    eps = 0.0001
-    new_verts = []
-    for v in verts:
-        for e in edges:
-            if v in e.verts:
-                continue
-
-            v1, v2 = e.verts
-            ortho = edge_vector(e).orthogonal().normalized() * eps
-            res = mathutils.geometry.intersect_line_line_2d(v.co, v.co, v1.co, v2.co)
-            if res is None:
-                res = mathutils.geometry.intersect_line_line_2d(v.co - ortho, v.co + ortho, v1.co, v2.co)
-
-            if res:
-                split_vert = v1
-                split_factor = (v1.co - v.co).length / e.calc_length()
-                new_edge, new_vert = bmesh.utils.edge_split(e, split_vert, split_factor)
-                new_verts.append(new_vert)
-    return validate(new_verts)
+        face.normal_update()
+        result.append(face)
+    return log_new_faces(result)
 
 
-def get_linked_edges(verts, filter_edges):
-    """Find all the edges linked to verts that are also in filter edges"""
-    linked_edges = [e for v in verts for e in v.link_edges]
-    return list(filter(lambda e: e in filter_edges, linked_edges))
-
-
-def find_closest_pair_edges(edges_a, edges_b):
-    """Find the edges in edges_a and edges_b that are closest to each other"""
-
-    def length_func(pair):
-        e1, e2 = pair
-        return (calc_edge_median(e1) - calc_edge_median(e2)).length
-
-    pairs = [(e1, e2) for e1 in edges_a for e2 in edges_b]
-    return sorted(pairs, key=length_func)[0]
-
-
-def join_intersections_and_get_skeleton_edges(bm, skeleton_verts, skeleton_edges):
-    """Join intersecting edges and verts and return all edges that are in skeleton_edges"""
-    new_verts = join_intersecting_verts_and_edges(bm, skeleton_edges, skeleton_verts)
-    skeleton_verts = validate(skeleton_verts) + new_verts
-    bmesh.ops.remove_doubles(bm, verts=skeleton_verts, dist=0.0001)
-    return list(set(e for v in validate(skeleton_verts) for e in v.link_edges))
+def skeleton_heights(skeleton):
+    """Height of each source and sink, as the last arc and the lowest arc give them"""
+    heights = {}
+    sink_heights = {}
+    for arc in skeleton:
+        heights[arc.source] = arc.height
+        for sink in arc.sinks:
+            sink_heights[sink] = min(arc.height, sink_heights.get(sink, arc.height))
+    sink_heights.update(heights)
+    return sink_heights
+
+
+class RoofPoints:
+    """Locations of roof verts, merging points that are equal in (x, y)"""
+
+    def __init__(self, locations, location, size=0.002):
+        self.locations = list(locations)
+        self.location = location
+        # -- cells are twice the tolerance of equal, so the cells around a point hold all its matches
+        self.size = size
+        self.cells = {}
+        for index, co in enumerate(self.locations):
+            self.cells.setdefault(self.cell(co), []).append(index)
+
+    def cell(self, point):
+        return math.floor(point.x / self.size), math.floor(point.y / self.size)
+
+    def index(self, point):
+        """Index of the location at point, adding one if there is none yet"""
+        cx, cy = self.cell(point)
+        for i in (-1, 0, 1):
+            for j in (-1, 0, 1):
+                for index in self.cells.get((cx + i, cy + j), []):
+                    co = self.locations[index]
+                    if equal(co.x, point.x) and equal(co.y, point.y):
+                        return index
+
+        self.locations.append(self.location(point))
+        self.cells.setdefault((cx, cy), []).append(len(self.locations) - 1)
+        return len(self.locations) - 1
+
+    def ring(self, points):
+        """Indices of the locations of points, without repeats"""
+        ring = []
+        for point in points:
+            index = self.index(point)
+            if not ring or index != ring[-1]:
+                ring.append(index)
+        if len(ring) > 1 and ring[0] == ring[-1]:
+            ring.pop()
+        return ring
+
+    def split_sides(self, rings, eps=0.001):
+        """Insert into the sides of rings the locations that lie on them
+
+        A point where the skeleton splits an arc is in the rings on one side of the arc only,
+        neighbouring faces have to share it so they are joined.
+        """
+        used = sorted({index for ring in rings for index in ring})
+        if not used:
+            return rings
+
+        # -- bucket the used locations in a grid about as coarse as the sides
+        sides = sum(len(ring) for ring in rings)
+        length = sum((self.locations[a] - self.locations[b]).length for ring in rings for a, b in ring_sides(ring))
+        size = max(length / sides, eps)
+        grid = {}
+        for index in used:
+            co = self.locations[index]
+            grid.setdefault((math.floor(co.x / size), math.floor(co.y / size)), []).append(index)
+
+        result = []
+        for ring in rings:
+            members = set(ring)
+            split = []
+            for a, b in ring_sides(ring):
+                split.append(a)
+                start, end = self.locations[a], self.locations[b]
+                x0, x1 = sorted((math.floor(start.x / size), math.floor(end.x / size)))
+                y0, y1 = sorted((math.floor(start.y / size), math.floor(end.y / size)))
+                between = []
+                for cx in range(x0 - 1, x1 + 2):
+                    for cy in range(y0 - 1, y1 + 2):
+                        for index in grid.get((cx, cy), []):
+                            if index in members:
+                                continue
+                            co = self.locations[index]
+                            point, factor = mathutils.geometry.intersect_point_line(co, start, end)
+                            if 0 < factor < 1 and (point - co).length <= eps:
+                                between.append((factor, index))
+                                members.add(index)
+                split.extend(index for _, index in sorted(between))
+            result.append(split)
+        return result
+
+
+def ring_sides(ring):
+    return zip(ring, ring[1:] + ring[:1])
 
 
 def dissolve_lone_verts(bm, face, original_edges):
@@ -317,14 +378,29 @@ def dissolve_lone_verts(bm, face, original_edges):
 
     parallel_verts = [loop.vert for loop in loops if is_parallel(loop)]
     lone_edges = [e for v in parallel_verts for e in v.link_edges if e not in original_edges]
-    bmesh.ops.dissolve_edges(bm, edges=lone_edges, use_verts=True)
+    track_faces(bmesh.ops.dissolve_edges)(bm, edges=lone_edges, use_verts=True)
+
+
+def simplify_footprint(bm, face, tolerance):
+    """Dissolve the verts of face that simplify_polygon drops at tolerance, return how many"""
+    verts = sort_verts_by_loops(face)
+    keep = set(simplify_polygon([v.co.to_tuple()[:2] for v in verts], tolerance))
+    removed = [v for i, v in enumerate(verts) if i not in keep]
+    if not removed:
+        return 0
+
+    # -- dissolving the edges below the verts merges the side faces and the verts with them
+    face_edges = set(face.edges)
+    edges = [e for v in removed for e in v.link_edges if e not in face_edges]
+    track_faces(bmesh.ops.dissolve_edges)(bm, edges=edges, use_verts=True)
+    return len(verts) - len(face.verts)
 
 
 def gable_process_box(bm, roof_faces, prop):
     """Finalize box gable roof type"""
     # -- extrude upward faces
     top_faces = [f for f in roof_faces if f.normal.z]
-    result = bmesh.ops.extrude_face_region(bm, geom=top_faces).get("geom")
+    result = track_faces(bmesh.ops.extrude_face_region)(bm, geom=top_faces).get("geom")
 
     # -- move abit upwards (by amount roof thickness)
     bmesh.ops.translate(bm, verts=filter_geom(result, BMVert), vec=(0, 0, prop.thickness))
@@ -344,7 +420,7 @@ def gable_process_open(bm, roof_faces, prop):
     top_faces = [f for f in roof_faces if f.normal.z]
 
     # -- extrude and move up
-    result = bmesh.ops.extrude_face_region(bm, geom=top_faces).get("geom")
+    result = track_faces(bmesh.ops.extrude_face_region)(bm, geom=top_faces).get("geom")
     bmesh.ops.translate(bm, verts=filter_geom(result, BMVert), vec=(0, 0, prop.thickness))
     bmesh.ops.delete(bm, geom=top_faces, context="FACES")
 
@@ -368,7 +444,7 @@ def gable_process_open(bm, roof_faces, prop):
         dissolve_edges.append(max_edge)
 
     # -- outset side faces
-    bmesh.ops.inset_region(bm, use_even_offset=True, faces=side_faces, depth=prop.outset)
+    track_faces(bmesh.ops.inset_region)(bm, use_even_offset=True, faces=side_faces, depth=prop.outset)
 
     # -- move lower vertical edges abit down (inorder to maintain roof slope)
     v_edges = []
@@ -382,7 +458,7 @@ def gable_process_open(bm, roof_faces, prop):
     bmesh.ops.translate(bm, verts=min_z_verts, vec=(0, 0, -prop.outset / 2))
 
     # -- post cleanup
-    bmesh.ops.dissolve_edges(bm, edges=dissolve_edges)
+    track_faces(bmesh.ops.dissolve_edges)(bm, edges=dissolve_edges)
 
     # -- facemaps
     linked = {f for fc in side_faces for e in fc.edges for f in e.link_faces}
@@ -395,23 +471,23 @@ def gable_process_open(bm, roof_faces, prop):
 def extrude_and_outset(bm, faces, thickness, outset):
     """Extrude the given faces upwards and outset resulting side faces"""
     # -- extrude faces upwards
-    ret = bmesh.ops.extrude_face_region(bm, geom=faces)
+    ret = track_faces(bmesh.ops.extrude_face_region)(bm, geom=faces)
     bmesh.ops.translate(bm, vec=(0, 0, thickness), verts=filter_geom(ret["geom"], BMVert))
 
     # -- dissolve top faces if they are more than one
     top_face = filter_geom(ret["geom"], BMFace)
     if len(top_face) > 1:
-        top_face = bmesh.ops.dissolve_faces(bm, faces=top_face, use_verts=True).get("region").pop()
+        top_face = track_faces(bmesh.ops.dissolve_faces)(bm, faces=top_face, use_verts=True).get("region").pop()
     else:
         top_face = top_face.pop()
 
     # -- outset the side faces from earlier extrusion
     link_faces = [f for e in top_face.edges for f in e.link_faces if f is not top_face]
-    bmesh.ops.inset_region(bm, faces=link_faces, depth=outset, use_even_offset=True)
+    track_faces(bmesh.ops.inset_region)(bm, faces=link_faces, depth=outset, use_even_offset=True)
 
     # -- cleanup hidden faces
     bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
     bmesh.ops.delete(bm, geom=faces, context="FACES")
 
     new_faces = list({f for e in top_face.edges for f in e.link_faces})
-    return bmesh.ops.dissolve_faces(bm, faces=new_faces).get("region")
+    return track_faces(bmesh.ops.dissolve_faces)(bm, faces=new_faces).get("region")
@@ -5,11 +5,12 @@ from ..facemap import (
     FaceMap,
     add_facemap_for_groups,
     verify_facemaps_for_object,
+    defer_facemap_updates,
 )
 
 from .stairs_types import create_stairs
 from .stairs_props import StairsProperty
-from ...utils import crash_safe, get_edit_mesh
+from ...utils import crash_safe, get_edit_mesh, cache_face_analysis
 from ...utils import get_selected_face_dimensions
 
 
@@ -34,6 +35,8 @@ class BTOOLS_OT_add_stairs(bpy.types.Operator):
         self.props.draw(context, self.layout)
 
 @crash_safe
+@defer_facemap_updates
+@cache_face_analysis
 def build(context, prop):
     verify_facemaps_for_object(context.object)
     me = get_edit_mesh()
@@ -25,6 +25,7 @@ from ...utils import (
     calc_face_dimensions,
     filter_parallel_edges,
     subdivide_face_vertically,
+    track_faces,
 )
 
 
@@ -151,7 +152,7 @@ def extrude_step(bm, face, normal, step_height, step_width):
     """Extrude a stair step from previous bottom face"""
     # extrude down
     n = face.normal.copy()
-    face = bmesh.ops.extrude_discrete_faces(bm, faces=[face]).get("faces")[0]
+    face = track_faces(bmesh.ops.extrude_discrete_faces)(bm, faces=[face]).get("faces")[0]
     bmesh.ops.translate(bm, vec=n * step_height, verts=face.verts)
 
     # extrude front
@@ -160,7 +161,7 @@ def extrude_step(bm, face, normal, step_height, step_width):
     flat_edges = list(
         {e for f in surrounding_faces for e in f.edges if -0.001 < e.calc_face_angle() < 0.001}
     )
-    bmesh.ops.dissolve_edges(bm, edges=flat_edges, use_verts=True)
+    track_faces(bmesh.ops.dissolve_edges)(bm, edges=flat_edges, use_verts=True)
     top_face = list(
         {f for e in front_face.edges for f in e.link_faces if vec_equal(f.normal, VEC_UP)}
     )[0]
@@ -201,20 +202,20 @@ def add_railing_to_stairs(bm, top_faces, normal, prop):
         v1, v2 = railing_verts(bm, sort_verts(first_step.verts, normal)[:2], normal, offset, corner_pw / 2)
         v3, v4 = railing_verts(bm, sort_verts(first_step.verts, normal)[-2:], normal, offset, -corner_pw / 2)
         v5, v6 = railing_verts(bm, sort_verts(last_step.verts, normal)[:2], normal, offset, prop.step_width - corner_pw / 2)
-        e1 = bmesh.ops.contextual_create(bm, geom=(v1, v3))["edges"][0]
-        e2 = bmesh.ops.contextual_create(bm, geom=[v3, v5])["edges"][0]
-        e3 = bmesh.ops.contextual_create(bm, geom=[v2, v4])["edges"][0]
-        e4 = bmesh.ops.contextual_create(bm, geom=[v4, v6])["edges"][0]
+        e1 = track_faces(bmesh.ops.contextual_create)(bm, geom=(v1, v3))["edges"][0]
+        e2 = track_faces(bmesh.ops.contextual_create)(bm, geom=[v3, v5])["edges"][0]
+        e3 = track_faces(bmesh.ops.contextual_create)(bm, geom=[v2, v4])["edges"][0]
+        e4 = track_faces(bmesh.ops.contextual_create)(bm, geom=[v4, v6])["edges"][0]
         railing_edges = [e1, e2, e3, e4]
     else:
         v1, v2 = railing_verts(bm, sort_verts(first_step.verts, normal)[:2], normal, offset, corner_pw / 2)
         v3, v4 = railing_verts(bm, sort_verts(last_step.verts, normal)[:2], normal, offset, prop.step_width - corner_pw / 2)
-        e1 = bmesh.ops.contextual_create(bm, geom=(v1, v3))["edges"][0]
-        e2 = bmesh.ops.contextual_create(bm, geom=[v2, v4])["edges"][0]
+        e1 = track_faces(bmesh.ops.contextual_create)(bm, geom=(v1, v3))["edges"][0]
+        e2 = track_faces(bmesh.ops.contextual_create)(bm, geom=[v2, v4])["edges"][0]
         railing_edges = [e1, e2]
 
     # extrude edges
-    ret = bmesh.ops.extrude_edge_only(bm, edges=railing_edges)
+    ret = track_faces(bmesh.ops.extrude_edge_only)(bm, edges=railing_edges)
     top_edges = filter_geom(ret["geom"], BMEdge)
     top_verts = list({v for e in top_edges for v in e.verts})
     bmesh.ops.translate(bm, verts=top_verts, vec=Vector((0.0, 0.0, 1.0)) * prop.rail.corner_post_height)
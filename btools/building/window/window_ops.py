@@ -5,12 +5,13 @@ from ..facemap import (
     FaceMap,
     add_facemap_for_groups,
     verify_facemaps_for_object,
+    defer_facemap_updates,
 )
 
 from .window_types import create_window
 from .window_props import WindowProperty
 from ...utils import get_selected_face_dimensions
-from ...utils import crash_safe, get_edit_mesh, is_rectangle
+from ...utils import crash_safe, get_edit_mesh, analyze_faces, cache_face_analysis
 
 
 class BTOOLS_OT_add_window(bpy.types.Operator):
@@ -36,6 +37,8 @@ class BTOOLS_OT_add_window(bpy.types.Operator):
 
 
 @crash_safe
+@defer_facemap_updates
+@cache_face_analysis
 def build(context, prop):
     verify_facemaps_for_object(context.object)
     me = get_edit_mesh()
@@ -59,7 +62,7 @@ def add_window_facemaps():
 def validate_window_faces(faces):
     """ Filter out invalid faces """
     # -- remove non-rectangular faces
-    faces = list(filter(lambda f: is_rectangle(f), faces))
+    faces = [f for f, analysis in zip(faces, analyze_faces(faces)) if analysis.is_rectangle]
     # -- remove faces that are perpendicular to Z+
     faces = list(filter(lambda f: round(abs(f.normal.z), 2) != 1.0, faces))
     return faces
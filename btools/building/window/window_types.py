@@ -41,33 +41,39 @@ from ...utils import (
     filter_horizontal_edges,
     subdivide_face_vertically,
     subdivide_face_horizontally,
+    remove_doubles_around,
+    track_faces,
+    collect_new_faces,
 )
 
 
 def create_window(bm, faces, prop):
     """Generate a window"""
-    for face in faces:
-        face.select_set(False)
-        if not valid_ngon(face):
-            ngon_to_quad(bm, face)
-
-        clamp_array_count(face, prop)
-        array_faces = subdivide_face_horizontally(bm, face, widths=[prop.width] * prop.count)
-        max_width = calc_face_dimensions(array_faces[0])[0]
-
-        split_edges = get_array_split_edges(array_faces)
-        split_faces = [create_window_split(bm, aface, prop) for aface in array_faces]
-        spread_array(bm, split_edges, split_faces, max_width, prop)
-
-        for face in split_faces:
-            window, arch = create_window_frame(bm, face, prop)
-            if prop.type == "RECTANGULAR":
-                fill_face(bm, window, prop, "WINDOW")
-                if prop.add_arch:
-                    fill_arch(bm, arch, prop)
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
-
-    nulfaces = find_faces_without_facemap(bm)
+    with collect_new_faces() as created:
+        for face in faces:
+            face.select_set(False)
+            if not valid_ngon(face):
+                ngon_to_quad(bm, face)
+
+            clamp_array_count(face, prop)
+            array_faces = subdivide_face_horizontally(bm, face, widths=[prop.width] * prop.count)
+            max_width = calc_face_dimensions(array_faces[0])[0]
+
+            split_edges = get_array_split_edges(array_faces)
+            split_faces = [create_window_split(bm, aface, prop) for aface in array_faces]
+            spread_array(bm, split_edges, split_faces, max_width, prop)
+
+            for face in split_faces:
+                window, arch = create_window_frame(bm, face, prop)
+                if prop.type == "RECTANGULAR":
+                    fill_face(bm, window, prop, "WINDOW")
+                    if prop.add_arch:
+                        fill_arch(bm, arch, prop)
+    created = validate(created)
+    # -- only weld the verts of the faces the build created
+    remove_doubles_around(bm, [v for f in created for v in f.verts], dist=0.0001)
+
+    nulfaces = find_faces_without_facemap(bm, validate(created + list(faces)))
     add_faces_to_map(bm, nulfaces, FaceMap.WALLS)
     return True
 
@@ -126,8 +132,8 @@ def create_circular_frame(bm, face, prop):
     arc_edge(bm, end, res, -radius, xyz)
 
     # -- inset for frame thicknes
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
-    res = bmesh.ops.inset_region(bm, faces=[mid], use_even_offset=True, thickness=prop.frame_thickness)
+    remove_doubles_around(bm, mid.verts, dist=0.0001)
+    res = track_faces(bmesh.ops.inset_region)(bm, faces=[mid], use_even_offset=True, thickness=prop.frame_thickness)
 
     # -- add window depth
     win, frames = add_window_depth(bm, mid, prop.window_depth, xyz[2])
@@ -16,6 +16,7 @@ from ...utils import (
     FaceMap,
     add_facemap_for_groups,
     filter_geom,
+    set_vert_uvs,
 )
 
 
@@ -285,10 +286,7 @@ class Road:
             last_position = current_position
 
         # Set uvs
-        for f in bm.faces:
-            for l in f.loops:
-                if l.vert.index < len(uv_coords):
-                    l[uv_layer].uv = uv_coords[l.vert.index]
+        set_vert_uvs(bm.faces, uv_layer, uv_coords)
 
         bm_to_obj(bm, context.active_object)
 
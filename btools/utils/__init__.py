@@ -6,4 +6,19 @@ from .util_material import *
 from .util_mesh import *
 from .util_object import *
 from .util_event import *
-from .util_skeleton import skeletonize
+from .util_face import (
+    FaceAnalysis,
+    face_analysis,
+    analyze_faces,
+    cache_face_analysis,
+    face_analysis_cache,
+)
+from .util_skeleton import (
+    Skeleton,
+    skeletonize,
+    iter_skeleton,
+    skeleton_cache,
+    skeletonize_many,
+    simplify_polygon,
+    skeletonize_faces,
+)
@@ -0,0 +1,151 @@
+import math
+from collections import namedtuple
+from functools import wraps
+
+import numpy as np
+from mathutils import Vector
+
+
+FaceAnalysis = namedtuple("FaceAnalysis", "width height x y z is_rectangle valid_ngon")
+FaceCacheInfo = namedtuple("FaceCacheInfo", "hits misses currsize")
+
+
+class FaceAnalysisCache:
+    """
+    Face analysis results, keyed by the vertex coordinates and normal of each face.
+    Faces that are moved, reshaped or flipped get a new key, so results never go stale,
+    and results are only kept while active (see cache_face_analysis).
+    """
+
+    def __init__(self):
+        self.active = False
+        self.hits = 0
+        self.misses = 0
+        self._data = {}
+
+    def analyze(self, faces):
+        keys = [face_key(face) for face in faces]
+        if not self.active:
+            return analyze_keys(keys)
+
+        missing = list(dict.fromkeys(key for key in keys if key not in self._data))
+        self.misses += len(missing)
+        self.hits += len(keys) - len(missing)
+        self._data.update(zip(missing, analyze_keys(missing)))
+        return [self._data[key] for key in keys]
+
+    def cache_info(self):
+        return FaceCacheInfo(self.hits, self.misses, len(self._data))
+
+    def cache_clear(self):
+        self.hits = self.misses = 0
+        self._data.clear()
+
+
+face_analysis_cache = FaceAnalysisCache()
+
+
+def cache_face_analysis(func):
+    """Decorator to keep face analysis results while func runs, e.g for the length of a build"""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if face_analysis_cache.active:
+            return func(*args, **kwargs)
+
+        face_analysis_cache.active = True
+        try:
+            return func(*args, **kwargs)
+        finally:
+            face_analysis_cache.active = False
+            face_analysis_cache._data.clear()
+
+    return wrapper
+
+
+def analyze_faces(faces):
+    """Width, height, local axes and rectangle tests of faces, see FaceAnalysis"""
+    return face_analysis_cache.analyze(faces)
+
+
+def face_analysis(face):
+    """FaceAnalysis of a single face, memoized while a build runs (see cache_face_analysis)
+
+    Outside of a build, calc_face_dimensions, is_rectangle and valid_ngon are cheaper for one face
+    """
+    return face_analysis_cache.analyze([face])[0]
+
+
+def face_key(face):
+    return tuple(v.co.to_tuple() for v in face.verts), face.normal.to_tuple()
+
+
+def analyze_keys(keys):
+    """Analyze the faces given by face_key in one pass over all their verts
+
+    Matches calc_face_dimensions, local_xyz, is_rectangle and valid_ngon for each face.
+    """
+    if not keys:
+        return []
+
+    counts = np.array([len(coords) for coords, _ in keys])
+    co = np.array([c for coords, _ in keys for c in coords], dtype=float)
+    normals = np.array([normal for _, normal in keys], dtype=float)
+
+    offsets = np.cumsum(counts) - counts
+    face_of = np.repeat(np.arange(len(keys)), counts)
+    starts, sizes = offsets[face_of], counts[face_of]
+    local = np.arange(len(co)) - starts
+    nxt = starts + (local + 1) % sizes
+    prv = starts + (local - 1) % sizes
+
+    # -- edge i of each face runs from vert i to vert i + 1, as in face.edges
+    vec = co[nxt] - co
+    length = np.linalg.norm(vec, axis=1)
+    unit = np.divide(vec, length[:, None], out=np.zeros_like(vec), where=length[:, None] > 0)
+    rx, ry, rz = np.round(unit, 3).T
+
+    # -- faces in the XY plane use 2D directions, as in filter_(horizontal|vertical)_edges
+    z = np.round(co[:, 2], 3)
+    flat = (np.maximum.reduceat(z, offsets) == np.minimum.reduceat(z, offsets))[face_of]
+    angle_up = np.round(np.arccos(np.clip(unit[:, 2], -1, 1)), 3)
+    horizontal = np.where(flat, np.abs(rx) == 1.0, (length > 0) & (angle_up == round(math.pi / 2, 3)))
+    vertical = np.where(flat, np.abs(ry) == 1.0, (rz != 0) & ~((rx != 0) & (ry != 0)))
+    widths = np.bincount(face_of, weights=length * horizontal, minlength=len(keys)) / 2
+    heights = np.bincount(face_of, weights=length * vertical, minlength=len(keys)) / 2
+    horizontal_counts = np.bincount(face_of, weights=horizontal, minlength=len(keys))
+
+    # -- corner angles, as pi - loop.calc_angle()
+    a, b = -unit[prv], unit
+    dot = np.einsum("ij,ij->i", a, b)
+    inner = np.where(
+        dot >= 0,
+        2 * np.arcsin(np.clip(np.linalg.norm(a - b, axis=1) / 2, 0, 1)),
+        math.pi - 2 * np.arcsin(np.clip(np.linalg.norm(a + b, axis=1) / 2, 0, 1)),
+    )
+    bend = math.pi - inner
+    right = np.abs(bend - math.pi / 2) < 0.001
+    straight = np.abs(bend) < 0.001
+    right_counts = np.bincount(face_of, weights=right, minlength=len(keys))
+    straight_counts = np.bincount(face_of, weights=straight, minlength=len(keys))
+    rectangles = (right_counts == 4) & (straight_counts == counts - 4)
+
+    # -- local axes, as in local_xyz
+    up = np.all(np.round(normals, 1) == (0, 0, 1), axis=1)
+    xs = np.cross(normals, np.where(up[:, None], (1, 0, 0), (0, 0, 1)))
+    ys = np.cross(xs, normals)
+
+    return [
+        FaceAnalysis(
+            round(float(w), 4),
+            round(float(h), 4),
+            Vector(x),
+            Vector(y),
+            Vector(n),
+            bool(rect),
+            bool(rect and hc == 2),
+        )
+        for w, h, x, y, n, rect, hc in zip(
+            widths, heights, xs, ys, normals, rectangles, horizontal_counts
+        )
+    ]
@@ -3,7 +3,7 @@ import itertools as it
 import bmesh
 from mathutils import Matrix, Vector
 
-from .util_mesh import face_with_verts
+from .util_mesh import face_with_verts, track_faces
 
 
 def cube(bm, width=2, length=2, height=2):
@@ -12,7 +12,7 @@ def cube(bm, width=2, length=2, height=2):
     sc_y = Matrix.Scale(length, 4, (0, 1, 0))
     sc_z = Matrix.Scale(height, 4, (0, 0, 1))
     mat = sc_x @ sc_y @ sc_z
-    return bmesh.ops.create_cube(bm, size=1, matrix=mat)
+    return track_faces(bmesh.ops.create_cube)(bm, size=1, matrix=mat)
 
 
 def plane(bm, width=2, length=2):
@@ -20,17 +20,17 @@ def plane(bm, width=2, length=2):
     sc_x = Matrix.Scale(width, 4, (1, 0, 0))
     sc_y = Matrix.Scale(length, 4, (0, 1, 0))
     mat = sc_x @ sc_y
-    return bmesh.ops.create_grid(bm, x_segments=1, y_segments=1, size=1, matrix=mat)
+    return track_faces(bmesh.ops.create_grid)(bm, x_segments=1, y_segments=1, size=1, matrix=mat)
 
 
 def circle(bm, radius=1, segs=10, cap_tris=False):
     """Create circle in the bmesh"""
-    return bmesh.ops.create_circle(bm, cap_ends=True, cap_tris=cap_tris, segments=segs, radius=radius)
+    return track_faces(bmesh.ops.create_circle)(bm, cap_ends=True, cap_tris=cap_tris, segments=segs, radius=radius)
 
 
 def cone(bm, r1=0.5, r2=0.01, height=2, segs=32):
     """Create a cone in the bmesh"""
-    return bmesh.ops.create_cone(
+    return track_faces(bmesh.ops.create_cone)(
         bm,
         radius1=r1,
         radius2=r2,
@@ -43,12 +43,12 @@ def cone(bm, r1=0.5, r2=0.01, height=2, segs=32):
 
 def cylinder(bm, radius=1, height=2, segs=10):
     """Create cylinder in bmesh"""
-    circle = bmesh.ops.create_circle(bm, cap_ends=True, cap_tris=False, segments=segs, radius=radius)
+    circle = track_faces(bmesh.ops.create_circle)(bm, cap_ends=True, cap_tris=False, segments=segs, radius=radius)
 
     verts = circle["verts"]
     face = list(verts[0].link_faces)
 
-    cylinder = bmesh.ops.extrude_discrete_faces(bm, faces=face)
+    cylinder = track_faces(bmesh.ops.extrude_discrete_faces)(bm, faces=face)
     bmesh.ops.translate(bm, verts=cylinder["faces"][-1].verts, vec=(0, 0, height))
 
     result = {"verts": verts + list(cylinder["faces"][-1].verts)}
@@ -26,6 +26,51 @@ def create_object_material(obj, mat_name):
     return obj.data.materials.get(mat_name)
 
 
+def uv_map_faces(bm, faces, method, texel_density=2.0):
+    """perform uv mapping on `faces` of `bm` using the provided `method`
+
+    CUBE_PROJECTION is computed directly on the loops, so it also works in object mode,
+    UNWRAP needs the unwrap operator and so edit mode.
+    """
+    if method == "CUBE_PROJECTION":
+        box_project_uvs(bm, faces, texel_density)
+    else:
+        uv_map_active_editmesh_selection(faces, method)
+
+
+def box_project_uvs(bm, faces, texel_density=2.0):
+    """Project each face onto the axis plane its normal is closest to, as cube projection does
+
+    The uvs are object space coordinates on that plane times texel_density (uv units per
+    unit length), so that neighbouring faces, and faces projected separately, line up.
+    """
+    uv_layer = bm.loops.layers.uv.verify()
+    for face in faces:
+        a, b = dominant_axes(face.normal)
+        for loop in face.loops:
+            co = loop.vert.co
+            loop[uv_layer].uv = (co[a] * texel_density, co[b] * texel_density)
+
+
+def dominant_axes(normal):
+    """The two axes of the plane that normal is closest to being perpendicular to"""
+    x, y, z = (abs(n) for n in normal)
+    if z >= x and z >= y:
+        return 0, 1
+    elif y >= x:
+        return 0, 2
+    return 1, 2
+
+
+def set_vert_uvs(faces, uv_layer, uvs):
+    """Set the uv of every loop of faces to uvs[loop.vert.index], where there is one"""
+    count = len(uvs)
+    for face in faces:
+        for loop in face.loops:
+            if loop.vert.index < count:
+                loop[uv_layer].uv = uvs[loop.vert.index]
+
+
 def uv_map_active_editmesh_selection(faces, method):
     """perform uv mapping on `faces` using the provided `method`"""
     # -- ensure we are in editmode
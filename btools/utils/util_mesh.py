@@ -2,13 +2,16 @@ import functools as ft
 import math
 import operator
 import collections
+from contextlib import contextmanager
 
 import bmesh
 import bpy
-from bmesh.types import BMVert, BMEdge, BMFace
+from bmesh.types import BMVert, BMEdge, BMFace, BMElemSeq
+from mathutils.kdtree import KDTree
 
 from .util_constants import VEC_UP, VEC_DOWN
 from .util_common import local_xyz, equal, minmax
+from .util_face import face_analysis, face_analysis_cache
 
 
 def get_edit_mesh():
@@ -37,6 +40,84 @@ def filter_geom(geom, _type):
     return list(filter(lambda x: isinstance(x, _type), geom))
 
 
+# -- faces logged while collect_new_faces is open, a dict (used as an ordered set) per scope, innermost last
+new_face_logs = []
+
+
+@contextmanager
+def collect_new_faces():
+    """Context manager to collect the faces made while it is open, see track_faces and log_new_faces
+
+    Yields a dict used as an ordered set of the faces, which is passed on to the enclosing
+    scope on exit, so e.g a build gets the faces of all its steps. Later steps may remove
+    some of the faces, see validate.
+    """
+    log = {}
+    new_face_logs.append(log)
+    try:
+        yield log
+    finally:
+        new_face_logs.pop()
+        if new_face_logs:
+            new_face_logs[-1].update(log)
+
+
+def log_new_faces(faces):
+    """Add faces made outside of bmesh operators (e.g by bm.faces.new) to the open collect_new_faces"""
+    if new_face_logs:
+        new_face_logs[-1].update(dict.fromkeys(faces))
+    return faces
+
+
+def track_faces(op):
+    """Wrap the bmesh operator op to log the faces it makes to the open collect_new_faces
+
+    The faces made are those around the verts of the input and output of op that were not
+    around the input before, so the cost follows the size of the geometry op works on.
+    Nothing is done when no collect_new_faces is open.
+    """
+
+    def wrapper(bm, **slots):
+        if not new_face_logs:
+            return op(bm, **slots)
+
+        # -- dissolved verts take their faces with them, so look one ring further around the input
+        ring = verts_in(slots.values())
+        ring.update(dict.fromkeys(v for f in faces_around(ring) for v in f.verts))
+        before = set(faces_around(ring))
+
+        result = op(bm, **slots)
+
+        verts = verts_in((result or {}).values())
+        verts.update(dict.fromkeys(validate(ring)))
+        log_new_faces([f for f in faces_around(verts) if f not in before])
+        return result
+
+    return wrapper
+
+
+def verts_in(values):
+    """Verts of the valid BMesh elements in values (or in the lists in values), as an ordered dict"""
+    verts = {}
+    for value in values:
+        if isinstance(value, (BMVert, BMEdge, BMFace)):
+            value = [value]
+        elif not isinstance(value, (list, tuple, set, BMElemSeq)):
+            continue
+
+        for el in value:
+            if isinstance(el, BMVert) and el.is_valid:
+                verts[el] = None
+            elif isinstance(el, (BMEdge, BMFace)) and el.is_valid:
+                verts.update(dict.fromkeys(el.verts))
+    return verts
+
+
+def faces_around(verts):
+    """Faces linked to verts, as an ordered dict"""
+    return dict.fromkeys(f for v in verts for f in v.link_faces)
+
+
 def edge_tangent(edge):
     """Find the tangent of an edge"""
     tan = None
@@ -85,12 +166,16 @@ def edge_is_sloped(e):
 
 def valid_ngon(face):
     """faces with rectangular shape and undivided horizontal edges are valid"""
+    if face_analysis_cache.active:
+        return face_analysis(face).valid_ngon
     horizontal_edges = filter_horizontal_edges(face.edges)
     return len(horizontal_edges) == 2 and is_rectangle(face)
 
 
 def is_rectangle(face):
     """check if face is rectangular"""
+    if face_analysis_cache.active:
+        return face_analysis(face).is_rectangle
     angles = [math.pi - l.calc_angle() for l in face.loops]
     right_angles = len([a for a in angles if math.pi / 2 - 0.001 < a < math.pi / 2 + 0.001])
     straight_angles = len([a for a in angles if -0.001 < a < 0.001])
@@ -194,6 +279,9 @@ def calc_faces_normal(faces):
 
 def calc_face_dimensions(face):
     """Determine the width and height of face"""
+    if face_analysis_cache.active:
+        analysis = face_analysis(face)
+        return analysis.width, analysis.height
     horizontal_edges = filter_horizontal_edges(face.edges)
     vertical_edges = filter_vertical_edges(face.edges)
     width = sum(e.calc_length() for e in horizontal_edges) / 2
@@ -203,13 +291,14 @@ def calc_face_dimensions(face):
 
 def face_with_verts(bm, verts, default=None):
     """Find a face in the bmesh with the given verts"""
-    for face in bm.faces:
-        equal = map(
-            operator.eq,
-            sorted(verts, key=operator.attrgetter("index")),
-            sorted(face.verts, key=operator.attrgetter("index")),
-        )
-        if len(face.verts) == len(verts) and all(equal):
+    verts = list(verts)
+    if not verts:
+        return default
+
+    # -- the face has to be linked to every one of verts, so only look around the first
+    vert_set = set(verts)
+    for face in verts[0].link_faces:
+        if len(face.verts) == len(verts) and vert_set.issuperset(face.verts):
             return face
     return default
 
@@ -238,15 +327,22 @@ def subdivide_edges(bm, edges, direction, widths):
     """Subdivide edges in a direction, widths in the direction"""
     dir = direction.copy().normalized()
     cuts = len(widths) - 1
-    res = bmesh.ops.subdivide_edges(bm, edges=edges, cuts=cuts)
+    res = track_faces(bmesh.ops.subdivide_edges)(bm, edges=edges, cuts=cuts)
     inner_edges = filter_geom(res.get("geom_inner"), BMEdge)
     distance = sum(widths) / len(widths)
+
+    # -- work out the offset of every cut first, then move the verts directly
+    # -- instead of dispatching a translate operator per inner edge
+    offsets = []
     final_position = 0.0
     for i, edge in enumerate(sort_edges(inner_edges, dir)):
         original_position = (i + 1) * distance
         final_position += widths[i]
-        diff = final_position - original_position
-        bmesh.ops.translate(bm, verts=edge.verts, vec=diff * dir)
+        offsets.append((edge.verts, (final_position - original_position) * dir))
+
+    for verts, offset in offsets:
+        for v in verts:
+            v.co += offset
     return inner_edges
 
 
@@ -256,7 +352,7 @@ def arc_edge(bm, edge, resolution, height, xyz, function="SPHERE"):
     median = calc_edge_median(edge)
     orient = xyz[0] if edge_is_horizontal(edge) else xyz[1]
     arc_direction = xyz[1] if edge_is_horizontal(edge) else xyz[0]
-    ret = bmesh.ops.subdivide_edges(bm, edges=[edge], cuts=resolution)
+    ret = track_faces(bmesh.ops.subdivide_edges)(bm, edges=[edge], cuts=resolution)
 
     verts = sort_verts(list({v for e in filter_geom(ret["geom_split"], bmesh.types.BMEdge) for v in e.verts}), orient)
     theta = math.pi / (len(verts) - 1)
@@ -279,7 +375,7 @@ def arc_edge(bm, edge, resolution, height, xyz, function="SPHERE"):
 
 def extrude_face(bm, face, extrude_depth):
     """extrude a face"""
-    extruded_face = bmesh.ops.extrude_discrete_faces(bm, faces=[face]).get("faces")[0]
+    extruded_face = track_faces(bmesh.ops.extrude_discrete_faces)(bm, faces=[face]).get("faces")[0]
     bmesh.ops.translate(bm, verts=extruded_face.verts, vec=extruded_face.normal * extrude_depth)
     surrounding_faces = list({f for edge in extruded_face.edges for f in edge.link_faces if f not in [extruded_face]})
     return extruded_face, surrounding_faces
@@ -288,7 +384,7 @@ def extrude_face(bm, face, extrude_depth):
 def extrude_face_region(bm, faces, depth, normal):
     """extrude a face and delete redundant faces"""
     initial_locations = [f.calc_center_bounds() for f in faces]
-    geom = bmesh.ops.extrude_face_region(bm, geom=faces).get("geom")
+    geom = track_faces(bmesh.ops.extrude_face_region)(bm, geom=faces).get("geom")
     verts = filter_geom(geom, BMVert)
     bmesh.ops.translate(bm, verts=verts, vec=normal * depth)
 
@@ -305,12 +401,17 @@ def extrude_face_region(bm, faces, depth, normal):
 
 
 def closest_faces(faces, locations):
-    def get_face(faces, location):
-        for f in faces:
-            if equal((f.calc_center_bounds() - location).length, 0):
-                return f
+    """For each location, the first of faces with its bounds center at location (or None)"""
+    tree = KDTree(len(faces))
+    for i, f in enumerate(faces):
+        tree.insert(f.calc_center_bounds(), i)
+    tree.balance()
+
+    def get_face(location):
+        found = [index for _, index, _ in tree.find_range(location, 0.001)]
+        return faces[min(found)] if found else None
 
-    return [get_face(faces, l) for l in locations]
+    return [get_face(l) for l in locations]
 
 
 def get_selected_face_dimensions(context):
@@ -331,7 +432,7 @@ def create_face(bm, size, offset, xyz):
     v3 = bmesh.ops.create_vert(bm, co=offset - size.x * xyz[0] / 2 + size.y * xyz[1] / 2)["vert"][0]
     v4 = bmesh.ops.create_vert(bm, co=offset - size.x * xyz[0] / 2 - size.y * xyz[1] / 2)["vert"][0]
 
-    return bmesh.ops.contextual_create(bm, geom=[v1, v2, v3, v4])["faces"][0]
+    return track_faces(bmesh.ops.contextual_create)(bm, geom=[v1, v2, v3, v4])["faces"][0]
 
 
 def get_top_edges(edges, n=1):
@@ -393,31 +494,48 @@ def ngon_to_quad(bm, face):
     """
 
     INSET_EPS = 0.0011
-    bmesh.ops.inset_individual(bm, faces=[face], thickness=INSET_EPS, use_even_offset=True)
+    track_faces(bmesh.ops.inset_individual)(bm, faces=[face], thickness=INSET_EPS, use_even_offset=True)
 
     diss_verts = list({loop.vert for loop in face.loops if equal(loop.calc_angle(), math.pi)})
     diss_edges = list({e for v in diss_verts for e in v.link_edges if e not in face.edges})
-    bmesh.ops.dissolve_edges(bm, edges=diss_edges)
-    bmesh.ops.dissolve_verts(bm, verts=diss_verts)
+    track_faces(bmesh.ops.dissolve_edges)(bm, edges=diss_edges)
+    track_faces(bmesh.ops.dissolve_verts)(bm, verts=diss_verts)
 
 
 def get_selection_groups(bm):
-    """Group faces that are selected and adjacent to each other"""
+    """Group faces that are selected and adjacent to each other
+
+    Groups are ordered by their first face in bm.faces, and faces in a group keep that order too.
+    """
     selected_faces = [f for f in bm.faces if f.select]
 
-    def get_adjacent_selected(faces):
-        return list({fa for f in faces for e in f.edges for fa in e.link_faces if fa.select})
+    group_of = {}
+    for start in selected_faces:
+        if start in group_of:
+            continue
 
-    result = []
-    while selected_faces:
-        current = selected_faces[0]
+        group_of[start] = start
+        stack = [start]
+        while stack:
+            face = stack.pop()
+            for edge in face.edges:
+                for other in edge.link_faces:
+                    if other.select and other not in group_of:
+                        group_of[other] = start
+                        stack.append(other)
 
-        faces = [current]
-        adjacent = get_adjacent_selected(faces)
-        while len(adjacent) > len(faces):
-            faces = adjacent[:]
-            adjacent = get_adjacent_selected(faces)
+    groups = {}
+    for face in selected_faces:
+        groups.setdefault(group_of[face], []).append(face)
+    return list(groups.values())
 
-        list(map(selected_faces.remove, adjacent))
-        result.append(adjacent)
-    return result
+
+def remove_doubles_around(bm, verts, dist=0.0001):
+    """remove_doubles on verts and the verts linked to them, instead of bm.verts
+
+    Meant for the verts an edit created (see collect_new_faces), so the cost follows
+    the size of the edit rather than the size of the mesh.
+    """
+    verts = dict.fromkeys(validate(verts))
+    verts.update(dict.fromkeys(e.other_vert(v) for v in list(verts) for e in v.link_edges))
+    bmesh.ops.remove_doubles(bm, verts=list(verts), dist=dist)
@@ -1,11 +1,20 @@
 """ Adapted from https://github.com/yonghah/polyskel
 """
 
+import os
+import sys
 import math
+import site
 import heapq
+import pickle
+import warnings
+import functools
 import operator as op
 import itertools as it
-from collections import namedtuple
+from collections import namedtuple, defaultdict, OrderedDict
+from importlib import util as importlib_util
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 
 class Vector2:
@@ -51,12 +60,6 @@ class Vector2:
     def __iter__(self):
         return iter((self.x, self.y))
 
-    def __getattr__(self, name):
-        try:
-            return tuple([(self.x, self.y)["xy".index(c)] for c in name])
-        except ValueError:
-            raise AttributeError(name)
-
     def __add__(self, other):
         if isinstance(other, Vector2):
             # Vector + Vector -> Vector
@@ -434,6 +437,18 @@ def approximately_same(point_a, point_b):
     )
 
 
+def normalized(x, y):
+    """Unit vector along (x, y), or (x, y) itself when it has zero length"""
+    d = math.sqrt(x ** 2 + y ** 2)
+    if d:
+        return x / d, y / d
+    return x, y
+
+
+def point_distance(a, b):
+    return math.sqrt((b.x - a.x) ** 2 + (b.y - a.y) ** 2)
+
+
 def normalize_contour(contour):
     contour = [Point2(float(x), float(y)) for (x, y) in contour]
     return [
@@ -445,6 +460,110 @@ def normalize_contour(contour):
     ]
 
 
+def simplify_polygon(polygon, tolerance):
+    """
+    Indices of the vertices of polygon that are kept when simplifying it within tolerance.
+
+    Vertices closer than tolerance to the previous kept vertex are dropped first, then a
+    Douglas-Peucker pass over the closed polygon and a last collinearity sweep drop the
+    vertices within tolerance of the line through their kept neighbours. The indices
+    are in polygon order, and the polygon is left as is if fewer than 3 vertices remain.
+    """
+    count = len(polygon)
+    if tolerance <= 0 or count <= 3:
+        return list(range(count))
+    points = [(float(x), float(y)) for x, y in polygon]
+
+    def distance(i, j):
+        return math.hypot(points[j][0] - points[i][0], points[j][1] - points[i][1])
+
+    # -- minimum edge length
+    keep = [0]
+    for i in range(1, count):
+        if distance(keep[-1], i) >= tolerance:
+            keep.append(i)
+    while len(keep) > 3 and distance(keep[-1], keep[0]) < tolerance:
+        keep.pop()
+    if len(keep) < 3:
+        return list(range(count))
+
+    # -- douglas-peucker, with the ring split at the vertex farthest from the first one
+    far = max(range(1, len(keep)), key=lambda k: distance(keep[0], keep[k]))
+    chain = _douglas_peucker(points, keep[: far + 1], tolerance)
+    chain += _douglas_peucker(points, keep[far:] + keep[:1], tolerance)[1:-1]
+    if len(chain) >= 3:
+        keep = chain
+
+    # -- collinearity, which also covers the two vertices the ring was split at
+    i = 0
+    while len(keep) > 3 and i < len(keep):
+        prev, next = keep[i - 1], keep[(i + 1) % len(keep)]
+        if _line_distance(points, prev, next, keep[i]) < tolerance:
+            keep.pop(i)
+        else:
+            i += 1
+    return keep
+
+
+def _line_distance(points, a, b, p):
+    """Distance from points[p] to the line through points[a] and points[b]"""
+    (ax, ay), (bx, by), (px, py) = points[a], points[b], points[p]
+    length = math.hypot(bx - ax, by - ay)
+    if not length:
+        return math.hypot(px - ax, py - ay)
+    return abs((bx - ax) * (py - ay) - (by - ay) * (px - ax)) / length
+
+
+def _douglas_peucker(points, chain, tolerance):
+    """Indices of chain kept by Douglas-Peucker, the ends are always kept"""
+    kept = {0, len(chain) - 1}
+    stack = [(0, len(chain) - 1)]
+    while stack:
+        start, end = stack.pop()
+        farthest, farthest_distance = None, tolerance
+        for k in range(start + 1, end):
+            d = _line_distance(points, chain[start], chain[end], chain[k])
+            if d >= farthest_distance:
+                farthest, farthest_distance = k, d
+        if farthest is not None:
+            kept.add(farthest)
+            stack.extend([(start, farthest), (farthest, end)])
+    return [chain[k] for k in sorted(kept)]
+
+
+class Edge:
+    """An original polygon edge, stored as plain floats
+
+    Edges are shared by every lav vertex that borders them, so they can be compared by identity.
+    """
+
+    __slots__ = ["x", "y", "vx", "vy", "ux", "uy"]
+
+    def __init__(self, start, end):
+        self.x = start.x
+        self.y = start.y
+        self.vx = end.x - start.x
+        self.vy = end.y - start.y
+        self.ux, self.uy = normalized(self.vx, self.vy)
+
+    def __repr__(self):
+        return "Edge(<%.2f, %.2f> to <%.2f, %.2f>)" % (
+            self.x,
+            self.y,
+            self.x + self.vx,
+            self.y + self.vy,
+        )
+
+    def distance(self, x, y):
+        """Distance from (x, y) to the line through this edge"""
+        u = ((x - self.x) * self.vx + (y - self.y) * self.vy) / (
+            self.vx ** 2 + self.vy ** 2
+        )
+        dx = self.x + u * self.vx - x
+        dy = self.y + u * self.vy - y
+        return math.sqrt(dx ** 2 + dy ** 2)
+
+
 # -- Event Type (etype) is 1
 class SplitEvent(
     namedtuple("SplitEvent", "distance intersection_point etype vertex opposite_edge")
@@ -469,12 +588,122 @@ class EdgeEvent(
         )
 
 
-OriginalEdge = namedtuple("_OriginalEdge", "edge bisector_left, bisector_right")
+OriginalEdge = namedtuple("_OriginalEdge", "edge vertex_left, vertex_right")
 
 Subtree = namedtuple("Subtree", "source, height, sinks")
+Skeleton = namedtuple("Skeleton", "subtrees, contours, faces")
+
+
+def bisector_spread(original_edge):
+    """Largest distance an end of original_edge's wavefront travels per unit of offset"""
+    edge = original_edge.edge
+    spread = 1.0
+    for vertex in (original_edge.vertex_left, original_edge.vertex_right):
+        sin = abs(edge.ux * vertex.bisector_uy - vertex.bisector_ux * edge.uy)
+        if sin == 0:
+            return math.inf
+        spread = max(spread, 1 / sin)
+    return spread
+
+
+class EdgeGrid:
+    """Uniform grid over the original edges, used to find split event candidates
+
+    A split point at offset distance h from an original edge lies between the
+    bisectors at the edge's ends, so it is at most h * spread away from the edge.
+    Together with the distance to the nearest event found so far, this bounds
+    how far from a reflex vertex the opposite edge can be, so next_event only
+    needs to visit the cells close to the vertex.
+    """
+
+    def __init__(self, original_edges):
+        xs = [x for e in original_edges for x in (e.edge.x, e.edge.x + e.edge.vx)]
+        ys = [y for e in original_edges for y in (e.edge.y, e.edge.y + e.edge.vy)]
+        self.min_x = min(xs, default=0.0)
+        self.min_y = min(ys, default=0.0)
+        width = max(xs, default=0.0) - self.min_x
+        height = max(ys, default=0.0) - self.min_y
+
+        # -- about one edge per square cell
+        count = max(1, len(original_edges))
+        self.cell_size = (
+            math.sqrt(width * height / count) or max(width, height) / count or 1.0
+        )
+        self.divisions_x = min(count, int(width / self.cell_size) + 1)
+        self.divisions_y = min(count, int(height / self.cell_size) + 1)
+        self.spread = max([bisector_spread(e) for e in original_edges], default=1.0)
+        # -- no point of the skeleton is higher than the largest circle that fits in the bounds
+        self.max_height = min(width, height) / 2
+
+        self.cells = defaultdict(list)
+        for index, e in enumerate(original_edges):
+            x1, y1 = e.edge.x, e.edge.y
+            x2, y2 = x1 + e.edge.vx, y1 + e.edge.vy
+            i0, j0 = self.cell_index(min(x1, x2), min(y1, y2))
+            i1, j1 = self.cell_index(max(x1, x2), max(y1, y2))
+            for i in range(i0, i1 + 1):
+                for j in range(j0, j1 + 1):
+                    self.cells[i, j].append(index)
+
+    def cell_index(self, x, y):
+        i = int((x - self.min_x) / self.cell_size)
+        j = int((y - self.min_y) / self.cell_size)
+        return (
+            min(max(i, 0), self.divisions_x - 1),
+            min(max(j, 0), self.divisions_y - 1),
+        )
+
+    def rings(self, point):
+        """Yield (min_distance, edge indices) for square rings of cells around point
+
+        Every edge is yielded once, and none of the edges in a ring is closer
+        to point than min_distance.
+        """
+        ci, cj = self.cell_index(point.x, point.y)
+        seen = set()
+        for k in range(max(self.divisions_x, self.divisions_y)):
+            i0, i1 = max(ci - k, 0), min(ci + k, self.divisions_x - 1)
+            j0, j1 = max(cj - k, 0), min(cj + k, self.divisions_y - 1)
+            # -- rows at cj -/+ k and columns at ci -/+ k, where they are inside the grid
+            keys = []
+            bottom, top = cj - k == j0, cj + k == j1 and k
+            if bottom:
+                keys.extend((i, j0) for i in range(i0, i1 + 1))
+            if top:
+                keys.extend((i, j1) for i in range(i0, i1 + 1))
+            column = range(j0 + 1 if bottom else j0, j1 if top else j1 + 1)
+            if ci - k == i0:
+                keys.extend((i0, j) for j in column)
+            if ci + k == i1 and k:
+                keys.extend((i1, j) for j in column)
+
+            indices = []
+            for key in keys:
+                for index in self.cells.get(key, ()):
+                    if index not in seen:
+                        seen.add(index)
+                        indices.append(index)
+            yield max(k - 1, 0) * self.cell_size, indices
 
 
 class LAVertex:
+    __slots__ = [
+        "point",
+        "edge_left",
+        "edge_right",
+        "prev",
+        "next",
+        "lav",
+        "_valid",
+        "_is_reflex",
+        "origin_x",
+        "origin_y",
+        "bisector_x",
+        "bisector_y",
+        "bisector_ux",
+        "bisector_uy",
+    ]
+
     def __init__(self, point, edge_left, edge_right, direction_vectors=None):
         self.point = point
         self.edge_left = edge_left
@@ -485,18 +714,29 @@ class LAVertex:
         self._valid = True
         # this should be handled better. Maybe membership in lav implies validity?
 
-        creator_vectors = (edge_left.v.normalized() * -1, edge_right.v.normalized())
+        # -- unit vectors along the edges, pointing away from the vertex
+        lx, ly = edge_left.ux * -1, edge_left.uy * -1
+        rx, ry = edge_right.ux, edge_right.uy
         if direction_vectors is None:
-            direction_vectors = creator_vectors
+            direction_vectors = ((lx, ly), (rx, ry))
 
-        self._is_reflex = (cross(*direction_vectors)) < 0
-        self._bisector = Ray2(
-            self.point, op.add(*creator_vectors) * (-1 if self.is_reflex else 1)
-        )
+        (ax, ay), (bx, by) = direction_vectors
+        self._is_reflex = (ax * by - bx * ay) < 0
+
+        # -- the bisector starts where the vertex was created, even if point moves later
+        sign = -1 if self._is_reflex else 1
+        self.origin_x = point.x
+        self.origin_y = point.y
+        self.bisector_x = (lx + rx) * sign
+        self.bisector_y = (ly + ry) * sign
+        self.bisector_ux, self.bisector_uy = normalized(self.bisector_x, self.bisector_y)
 
     @property
     def bisector(self):
-        return self._bisector
+        return Ray2(
+            Point2(self.origin_x, self.origin_y),
+            Vector2(self.bisector_x, self.bisector_y),
+        )
 
     @property
     def is_reflex(self):
@@ -506,89 +746,163 @@ class LAVertex:
     def original_edges(self):
         return self.lav._slav._original_edges
 
-    def next_event(self):
-        events = []
-        if self.is_reflex:
-            for edge in self.original_edges:
-                if edge.edge == self.edge_left or edge.edge == self.edge_right:
-                    continue
-
-                leftdot = abs(
-                    self.edge_left.v.normalized().dot(edge.edge.v.normalized())
-                )
-                rightdot = abs(
-                    self.edge_right.v.normalized().dot(edge.edge.v.normalized())
-                )
-                selfedge = self.edge_left if leftdot < rightdot else self.edge_right
-
-                i = Line2(selfedge).intersect(Line2(edge.edge))
-                if i is not None and not approximately_equals(i, self.point):
-                    # locate candidate b
-                    linvec = (self.point - i).normalized()
-                    edvec = edge.edge.v.normalized()
-                    if linvec.dot(edvec) < 0:
-                        edvec = -edvec
-
-                    bisecvec = edvec + linvec
-                    if abs(bisecvec) == 0:
-                        continue
-                    bisector = Line2(i, bisecvec)
-                    b = bisector.intersect(self.bisector)
-
-                    if b is None:
-                        continue
-
-                    xleft = (
-                        cross(
-                            edge.bisector_left.v.normalized(),
-                            (b - edge.bisector_left.p).normalized(),
-                        )
-                        > 0
-                    )
-                    xright = (
-                        cross(
-                            edge.bisector_right.v.normalized(),
-                            (b - edge.bisector_right.p).normalized(),
-                        )
-                        < 0
-                    )
-                    xedge = (
-                        cross(edge.edge.v.normalized(), (b - edge.edge.p).normalized())
-                        < 0
-                    )
+    def intersect_bisectors(self, other):
+        """Point where the bisector of other meets the bisector of this vertex, or None"""
+        d = self.bisector_y * other.bisector_x - self.bisector_x * other.bisector_y
+        if d == 0:
+            return None
 
-                    if not (xleft and xright and xedge):
-                        continue
+        dy = other.origin_y - self.origin_y
+        dx = other.origin_x - self.origin_x
+        ua = (self.bisector_x * dy - self.bisector_y * dx) / d
+        if not ua >= 0.0:
+            return None
+        ub = (other.bisector_x * dy - other.bisector_y * dx) / d
+        if not ub >= 0.0:
+            return None
 
-                    events.append(
-                        SplitEvent(Line2(edge.edge).distance(b), b, 0, self, edge.edge)
-                    )
+        return Point2(other.origin_x + ua * other.bisector_x, other.origin_y + ua * other.bisector_y)
 
-        i_prev = self.bisector.intersect(self.prev.bisector)
-        i_next = self.bisector.intersect(self.next.bisector)
+    def next_event(self):
+        edge_events = []
+        i_prev = self.intersect_bisectors(self.prev)
+        i_next = self.intersect_bisectors(self.next)
 
         if i_prev is not None:
-            events.append(
+            edge_events.append(
                 EdgeEvent(
-                    Line2(self.edge_left).distance(i_prev), i_prev, 1, self.prev, self
+                    self.edge_left.distance(i_prev.x, i_prev.y), i_prev, 1, self.prev, self
                 )
             )
         if i_next is not None:
-            events.append(
+            edge_events.append(
                 EdgeEvent(
-                    Line2(self.edge_right).distance(i_next), i_next, 1, self, self.next
+                    self.edge_right.distance(i_next.x, i_next.y), i_next, 1, self, self.next
                 )
             )
 
+        events = []
+        if self.is_reflex:
+            events.extend(self._split_events(edge_events))
+        events.extend(edge_events)
+
         if not events:
             return None
 
         ev = min(
-            events, key=lambda event: self.point.distance(event.intersection_point)
+            events, key=lambda event: point_distance(self.point, event.intersection_point)
         )
 
         return ev
 
+    def _split_events(self, edge_events):
+        """Find the split events of this (reflex) vertex that could be its nearest event"""
+        slav = self.lav._slav
+        grid = slav._edge_grid
+
+        # -- offset distance of this vertex, split points at distance d from
+        # -- the vertex are at most offset + d from the opposite edge's line
+        px, py = self.point.x, self.point.y
+        offset = max(self.edge_left.distance(px, py), self.edge_right.distance(px, py))
+
+        # -- without an edge event, the split point is at most grid.max_height high,
+        # -- and the height grows by sin along the bisector
+        sin = abs(self.edge_left.ux * self.bisector_uy - self.bisector_ux * self.edge_left.uy)
+        nearest = min(
+            [point_distance(self.point, e.intersection_point) for e in edge_events],
+            default=max(grid.max_height - offset, 0.0) / sin if sin else math.inf,
+        )
+
+        found = {}
+        for min_distance, indices in grid.rings(self.point):
+            reach = nearest + (offset + nearest) * grid.spread
+            if min_distance > reach * (1 + 1e-6) + 1e-9:
+                break
+
+            for index in indices:
+                event = self._split_event(self.original_edges[index])
+                if event is not None:
+                    found[index] = event
+                    nearest = min(
+                        nearest, point_distance(self.point, event.intersection_point)
+                    )
+
+        # -- keep original edge order so that ties resolve as a full scan would
+        return [found[index] for index in sorted(found)]
+
+    def _split_event(self, original_edge):
+        edge = original_edge.edge
+        if edge is self.edge_left or edge is self.edge_right:
+            return None
+
+        leftdot = abs(self.edge_left.ux * edge.ux + self.edge_left.uy * edge.uy)
+        rightdot = abs(self.edge_right.ux * edge.ux + self.edge_right.uy * edge.uy)
+        selfedge = self.edge_left if leftdot < rightdot else self.edge_right
+
+        # -- i, where the lines through selfedge and edge meet
+        d = selfedge.vy * edge.vx - selfedge.vx * edge.vy
+        if d == 0:
+            return None
+        u = (selfedge.vx * (edge.y - selfedge.y) - selfedge.vy * (edge.x - selfedge.x)) / d
+        ix = edge.x + u * edge.vx
+        iy = edge.y + u * edge.vy
+
+        px, py = self.point.x, self.point.y
+        if (ix == px and iy == py) or math.sqrt((ix - px) ** 2 + (iy - py) ** 2) <= max(
+            math.sqrt(ix ** 2 + iy ** 2), math.sqrt(px ** 2 + py ** 2)
+        ) * 0.001:
+            return None
+
+        # -- locate candidate b, where the bisector of the angle at i meets our bisector
+        lx, ly = normalized(px - ix, py - iy)
+        ex, ey = edge.ux, edge.uy
+        if lx * ex + ly * ey < 0:
+            ex, ey = -ex, -ey
+
+        vx = ex + lx
+        vy = ey + ly
+        if vx ** 2 + vy ** 2 == 0:
+            return None
+
+        d = vy * self.bisector_x - vx * self.bisector_y
+        if d == 0:
+            return None
+        u = (vx * (self.origin_y - iy) - vy * (self.origin_x - ix)) / d
+        if not u >= 0.0:
+            return None
+        bx = self.origin_x + u * self.bisector_x
+        by = self.origin_y + u * self.bisector_y
+
+        # -- b has to lie inside the region swept by the opposite edge
+        left = original_edge.vertex_left
+        x, y = normalized(bx - left.origin_x, by - left.origin_y)
+        if not left.bisector_ux * y - x * left.bisector_uy > 0:
+            return None
+
+        right = original_edge.vertex_right
+        x, y = normalized(bx - right.origin_x, by - right.origin_y)
+        if not right.bisector_ux * y - x * right.bisector_uy < 0:
+            return None
+
+        x, y = normalized(bx - edge.x, by - edge.y)
+        if not edge.ux * y - x * edge.uy < 0:
+            return None
+
+        return SplitEvent(edge.distance(bx, by), Point2(bx, by), 0, self, edge)
+
+    def offset_point(self, distance):
+        """Position of this vertex when the wavefront is at offset distance from the original edges"""
+        edge = self.edge_left
+        sin = abs(edge.ux * self.bisector_uy - self.bisector_ux * edge.uy)
+        if sin == 0:
+            return Point2(self.point.x, self.point.y)
+
+        length = (distance - edge.distance(self.origin_x, self.origin_y)) / sin
+        return Point2(
+            self.origin_x + length * self.bisector_ux,
+            self.origin_y + length * self.bisector_uy,
+        )
+
     def invalidate(self):
         if self.lav is not None:
             self.lav.invalidate(self)
@@ -618,21 +932,28 @@ class LAVertex:
 
 
 class SLAV:
-    def __init__(self, polygon, holes):
+    def __init__(self, polygon, holes, faces=True):
         contours = [normalize_contour(polygon)]
-        contours.extend([normalize_contour(hole) for hole in holes])
+        contours.extend([normalize_contour(hole) for hole in holes or []])
 
+        # live lav vertices, by the original edge on either side of them
+        self._edge_vertices = defaultdict(list)
         self._lavs = [LAV.from_polygon(contour, self) for contour in contours]
 
         # store original polygon edges for calculating split events
         self._original_edges = [
-            OriginalEdge(
-                LineSegment2(vertex.prev.point, vertex.point),
-                vertex.prev.bisector,
-                vertex.bisector,
-            )
+            OriginalEdge(vertex.edge_left, vertex.prev, vertex)
             for vertex in it.chain.from_iterable(self._lavs)
         ]
+        self._edge_grid = EdgeGrid(self._original_edges)
+
+        # arcs traced by the vertices, as (edge_left, edge_right, sink, source), if faces are wanted
+        self._arcs = [] if faces else None
+        self._original_points = frozenset(
+            Point2(x, y)
+            for e in self._original_edges
+            for x, y in ((e.edge.x, e.edge.y), (e.edge.x + e.edge.vx, e.edge.y + e.edge.vy))
+        )
 
     def __iter__(self):
         for lav in self._lavs:
@@ -644,6 +965,59 @@ class SLAV:
     def empty(self):
         return len(self._lavs) == 0
 
+    def add_vertex(self, vertex):
+        for edge in (vertex.edge_left, vertex.edge_right):
+            vertices = self._edge_vertices[edge]
+            if vertex not in vertices:
+                vertices.append(vertex)
+
+    def remove_vertex(self, vertex):
+        for edge in (vertex.edge_left, vertex.edge_right):
+            vertices = self._edge_vertices[edge]
+            if vertex in vertices:
+                vertices.remove(vertex)
+
+    def _lav_order(self, vertices):
+        """Positions of vertices in the live lavs, as (lav index, index in the lav)"""
+        vertices = list(vertices)
+        if len(vertices) == 1:
+            return {vertices[0]: (0, 0)} if vertices[0].lav in self._lavs else {}
+
+        lavs = {vertex.lav for vertex in vertices}
+        order = {}
+        for i, lav in enumerate(self._lavs):
+            if lav in lavs:
+                order.update(((vertex, (i, j)) for j, vertex in enumerate(lav)))
+        return order
+
+    def add_arcs(self, vertices, source):
+        """Record the arcs from vertices to source, which split the faces on their two sides"""
+        if self._arcs is None:
+            return
+        for vertex in vertices:
+            self._arcs.append((vertex.edge_left, vertex.edge_right, vertex.point, source))
+
+    def faces(self, top_edges=()):
+        """
+        Ordered ring of points around the face of each original edge, in original edge order.
+
+        Each ring starts with the start and end points of its edge, followed by the skeleton
+        points around the face. Top edges are (edge, start, end) for the faces cut off at a
+        max_height, ending on the segment from start to end of the offset contour.
+        """
+        segments = defaultdict(list)
+        for edge_left, edge_right, sink, source in self._arcs:
+            if (sink.x, sink.y) != (source.x, source.y):
+                segments[edge_left].append((sink, source))
+                segments[edge_right].append((sink, source))
+        for edge, start, end in top_edges:
+            segments[edge].append((start, end))
+
+        return [
+            _face_ring(e.vertex_left.point, e.vertex_right.point, segments[e.edge])
+            for e in self._original_edges
+        ]
+
     def handle_edge_event(self, event, zero_gradient):
         sinks = []
         events = []
@@ -651,7 +1025,8 @@ class SLAV:
         lav = event.vertex_a.lav
         if event.vertex_a.prev == event.vertex_b.next:
             self._lavs.remove(lav)
-            for vertex in list(lav):
+            vertices = list(lav)
+            for vertex in vertices:
                 sinks.append(vertex.point)
                 vertex.invalidate()
         else:
@@ -660,19 +1035,17 @@ class SLAV:
             )
             if lav.head in (event.vertex_a, event.vertex_b):
                 lav.head = new_vertex
+            vertices = [event.vertex_a, event.vertex_b]
             sinks.extend((event.vertex_a.point, event.vertex_b.point))
             next_event = new_vertex.next_event()
             if next_event is not None:
                 events.append(next_event)
+        self.add_arcs(vertices, event.intersection_point)
 
         # -- gable roof processing
         if zero_gradient:
-            original_points = []
-            for e in self._original_edges:
-                original_points.extend([e.edge.p1, e.edge.p2])
-
             len_sinks = len(sinks)
-            set_diff = set(sinks) - set(original_points)
+            set_diff = set(sinks) - self._original_points
             len_diff = len(list(set_diff))
 
             midpoint = event.intersection_point
@@ -695,45 +1068,34 @@ class SLAV:
         vertices = []
         x = None  # right vertex
         y = None  # left vertex
-        norm = event.opposite_edge.v.normalized()
-        for v in it.chain.from_iterable(self._lavs):
-            if (
-                norm == v.edge_left.v.normalized()
-                and event.opposite_edge.p == v.edge_left.p
-            ):
+        point = event.intersection_point
+        edge = event.opposite_edge
+        candidates = []
+        for v in self._edge_vertices[edge]:
+            if v.edge_left is edge:
                 x = v
                 y = x.prev
-            elif (
-                norm == v.edge_right.v.normalized()
-                and event.opposite_edge.p == v.edge_right.p
-            ):
+            elif v.edge_right is edge:
                 y = v
                 x = y.next
 
             if x:
-                xleft = (
-                    cross(
-                        y.bisector.v.normalized(),
-                        (event.intersection_point - y.point).normalized(),
-                    )
-                    >= 0
-                )
-                xright = (
-                    cross(
-                        x.bisector.v.normalized(),
-                        (event.intersection_point - x.point).normalized(),
-                    )
-                    <= 0
-                )
+                dx, dy = normalized(point.x - y.point.x, point.y - y.point.y)
+                xleft = y.bisector_ux * dy - dx * y.bisector_uy >= 0
+                dx, dy = normalized(point.x - x.point.x, point.y - x.point.y)
+                xright = x.bisector_ux * dy - dx * x.bisector_uy <= 0
 
                 if xleft and xright:
-                    break
-                else:
-                    x = None
-                    y = None
-
-        if x is None:
+                    candidates.append((v, x, y))
+                x = None
+                y = None
+
+        # -- take the first vertex in the order of the lavs, and of the vertices in each lav
+        order = self._lav_order(v for v, _, _ in candidates)
+        candidates = [c for c in candidates if c[0] in order]
+        if not candidates:
             return (None, [])
+        _, x, y = min(candidates, key=lambda c: order[c[0]])
 
         v1 = LAVertex(
             event.intersection_point, event.vertex.edge_left, event.opposite_edge
@@ -761,12 +1123,14 @@ class SLAV:
         else:
             new_lavs = [LAV.from_chain(v1, self), LAV.from_chain(v2, self)]
 
+        self.add_arcs([event.vertex], event.intersection_point)
         for l in new_lavs:
             if len(l) > 2:
                 self._lavs.append(l)
                 vertices.append(l.head)
             else:
                 sinks.append(l.head.next.point)
+                self.add_arcs([l.head.next], event.intersection_point)
                 for v in list(l):
                     v.invalidate()
 
@@ -780,6 +1144,38 @@ class SLAV:
         return (Subtree(event.intersection_point, event.distance, sinks), events)
 
 
+def _face_ring(start, end, segments):
+    """
+    Chain segments into the ring of points from end back to start, see SLAV.faces
+
+    If the segments do not form a chain back to start, the face is left open and the
+    ring holds only the edge from start to end, with a warning.
+    """
+    by_point = defaultdict(list)
+    for index, (a, b) in enumerate(segments):
+        by_point[a.x, a.y].append(index)
+        by_point[b.x, b.y].append(index)
+
+    ring = [start, end]
+    used = set()
+    current = end
+    while (current.x, current.y) != (start.x, start.y):
+        candidates = [i for i in by_point[current.x, current.y] if i not in used]
+        if not candidates:
+            warnings.warn(
+                "Skeleton face of edge {} - {} is not closed at {}".format(start, end, current),
+                RuntimeWarning,
+            )
+            return [start, end]
+        index = candidates[0]
+        used.add(index)
+        a, b = segments[index]
+        current = a if (b.x, b.y) == (current.x, current.y) else b
+        if (current.x, current.y) != (start.x, start.y):
+            ring.append(current)
+    return ring
+
+
 class LAV:
     def __init__(self, slav):
         self.head = None
@@ -789,12 +1185,12 @@ class LAV:
     @classmethod
     def from_polygon(cls, polygon, slav):
         lav = cls(slav)
-        for prev, point, next in window(polygon):
+        edges = [Edge(prev, point) for prev, point, next in window(polygon)]
+        for point, edge_left, edge_right in zip(polygon, edges, edges[1:] + edges[:1]):
             lav._len += 1
-            vertex = LAVertex(
-                point, LineSegment2(prev, point), LineSegment2(point, next)
-            )
+            vertex = LAVertex(point, edge_left, edge_right)
             vertex.lav = lav
+            slav.add_vertex(vertex)
             if lav.head is None:
                 lav.head = vertex
                 vertex.prev = vertex.next = vertex
@@ -812,6 +1208,7 @@ class LAV:
         for vertex in lav:
             lav._len += 1
             vertex.lav = lav
+            slav.add_vertex(vertex)
         return lav
 
     def invalidate(self, vertex):
@@ -820,15 +1217,20 @@ class LAV:
         if self.head == vertex:
             self.head = self.head.next
         vertex.lav = None
+        self._slav.remove_vertex(vertex)
 
     def unify(self, vertex_a, vertex_b, point):
         replacement = LAVertex(
             point,
             vertex_a.edge_left,
             vertex_b.edge_right,
-            (vertex_b.bisector.v.normalized(), vertex_a.bisector.v.normalized()),
+            (
+                (vertex_b.bisector_ux, vertex_b.bisector_uy),
+                (vertex_a.bisector_ux, vertex_a.bisector_uy),
+            ),
         )
         replacement.lav = self
+        self._slav.add_vertex(replacement)
 
         if self.head in [vertex_a, vertex_b]:
             self.head = replacement
@@ -896,19 +1298,65 @@ class EventQueue:
             print(item)
 
 
-def skeletonize(polygon, holes=None, zero_gradient=False):
+def skeletonize(polygon, holes=None, zero_gradient=False, max_height=None):
     """
     Compute the straight skeleton of a polygon.
 
     The polygon should be given as a list of vertices in counter-clockwise order.
     Holes is a list of the contours of the holes, the vertices of which should be in clockwise order.
     Zero gradient is an option to control the gradient between sinks and original_edges (produces gable roof)
+    Max height stops the skeleton at that offset distance (produces truncated hip roofs)
 
     Returns the straight skeleton as a list of "subtrees", which are in the form of (source, height, sinks),
     where source is the highest points, height is its height, and sinks are the point connected to the source.
+
+    When max_height is given, returns (subtrees, contours) instead. If the skeleton reaches max_height,
+    every vertex still moving gets a subtree with its position at max_height as the source, and contours
+    holds the offset contours at max_height, as lists of those points. Otherwise contours is empty.
     """
-    slav = SLAV(polygon, holes)
     output = []
+    subtrees = iter_skeleton(polygon, holes, zero_gradient, max_height)
+    while True:
+        try:
+            output.append(next(subtrees))
+        except StopIteration as stop:
+            contours, _ = stop.value
+            break
+
+    if max_height is None:
+        return output
+    return output, contours
+
+
+def skeletonize_faces(polygon, holes=None, zero_gradient=False, max_height=None):
+    """
+    Compute the straight skeleton of a polygon along with the face of each original edge.
+
+    Takes the same arguments as skeletonize and returns a Skeleton of (subtrees, contours, faces),
+    where contours is empty unless the skeleton was cut off at max_height. Faces holds a ring of
+    points for every original edge, in the order of the polygon and then the holes. Each ring
+    starts with the start and end points of the edge and goes on around the edge's face.
+    """
+    subtrees = []
+    solve = iter_skeleton(polygon, holes, zero_gradient, max_height, faces=True)
+    while True:
+        try:
+            subtrees.append(next(solve))
+        except StopIteration as stop:
+            contours, faces = stop.value
+            return Skeleton(subtrees, contours, faces)
+
+
+def iter_skeleton(polygon, holes=None, zero_gradient=False, max_height=None, faces=False):
+    """
+    Generate the subtrees of the straight skeleton of a polygon as the events are resolved.
+
+    Takes the same arguments as skeletonize and yields the same subtrees, in the same order. The
+    generator returns (contours, faces), with the offset contours at max_height (see skeletonize)
+    and the face rings of the original edges (see skeletonize_faces) when faces is True, or None
+    for faces otherwise.
+    """
+    slav = SLAV(polygon, holes, faces)
     prioque = EventQueue()
 
     for lav in slav:
@@ -916,7 +1364,12 @@ def skeletonize(polygon, holes=None, zero_gradient=False):
             v = vertex.next_event()
             prioque.put(v)
 
+    truncated = False
     while not (prioque.empty() or slav.empty()):
+        if max_height is not None and prioque.peek().distance > max_height:
+            truncated = True
+            break
+
         i = prioque.get()
         if isinstance(i, EdgeEvent):
             if not i.vertex_a.is_valid or not i.vertex_b.is_valid:
@@ -931,6 +1384,246 @@ def skeletonize(polygon, holes=None, zero_gradient=False):
         prioque.put_all(events)
 
         if arc is not None:
-            output.append(arc)
+            yield arc
+
+    contours = []
+    top_edges = []
+    if truncated:
+        for lav in slav:
+            contour = [vertex.offset_point(max_height) for vertex in lav]
+            for point, vertex in zip(contour, lav):
+                slav.add_arcs([vertex], point)
+                yield Subtree(point, max_height, [vertex.point])
+            for start, end, vertex in zip(contour, contour[1:] + contour[:1], lav):
+                top_edges.append((vertex.edge_right, start, end))
+            contours.append(contour)
+    return contours, slav.faces(top_edges) if faces else None
+
+
+def skeletonize_many(polygons, zero_gradient=False, max_height=None, workers=None, mp_context=None):
+    """
+    Compute the straight skeletons of several polygons in a pool of worker processes.
+
+    Polygons (without holes) share the other arguments of skeletonize, and their Skeletons
+    (see skeletonize_faces) are returned in order. Workers defaults to the number of cpus,
+    mp_context is passed on to the ProcessPoolExecutor. With a single worker or polygon
+    the skeletons are computed in this process, as they are (with a warning) when the
+    pool cannot be started.
+    """
+    polygons = [[(float(x), float(y)) for x, y in polygon] for polygon in polygons]
+    workers = min(workers or os.cpu_count() or 1, len(polygons))
+    if workers <= 1:
+        return [skeletonize_faces(polygon, [], zero_gradient, max_height) for polygon in polygons]
+
+    # -- the workers run this file as a top level module, importing btools would import bpy
+    solve = functools.partial(
+        _standalone_module()._solve_plain, zero_gradient=zero_gradient, max_height=max_height
+    )
+    chunksize = max(1, len(polygons) // (workers * 4))
+    try:
+        with ProcessPoolExecutor(
+            workers, mp_context=mp_context, initializer=site.addsitedir, initargs=(os.path.dirname(__file__),)
+        ) as pool:
+            return [_from_plain(result) for result in pool.map(solve, polygons, chunksize=chunksize)]
+    except (OSError, BrokenProcessPool, pickle.PicklingError) as error:
+        # -- e.g no processes allowed
+        warnings.warn("Skeleton workers failed ({!r}), solving in this process".format(error), RuntimeWarning)
+        return [skeletonize_faces(polygon, [], zero_gradient, max_height) for polygon in polygons]
+
+
+def _standalone_module():
+    """This file loaded as the top level module the worker processes of skeletonize_many import
+
+    Workers unpickle the function they run by its module name. They add the directory of
+    this file to sys.path, so that name is the file name.
+    """
+    name = os.path.splitext(os.path.basename(__file__))[0]
+    if __name__ == name:
+        return sys.modules[name]
+    module = sys.modules.get(name)
+    if module is None or getattr(module, "__file__", None) != __file__:
+        spec = importlib_util.spec_from_file_location(name, __file__)
+        module = importlib_util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules[name] = module
+    return module
+
+
+def _solve_plain(polygon, zero_gradient=False, max_height=None):
+    """skeletonize_faces in a worker, as tuples of floats that unpickle without this module"""
+    skeleton = skeletonize_faces(polygon, [], zero_gradient, max_height)
+    return (
+        [((arc.source.x, arc.source.y), arc.height, [(p.x, p.y) for p in arc.sinks]) for arc in skeleton.subtrees],
+        [[(p.x, p.y) for p in ring] for ring in skeleton.contours],
+        [[(p.x, p.y) for p in ring] for ring in skeleton.faces],
+    )
+
+
+def _from_plain(result):
+    """The Skeleton of a result of _solve_plain"""
+    subtrees, contours, faces = result
+    return Skeleton(
+        [Subtree(Point2(*source), height, [Point2(*p) for p in sinks]) for source, height, sinks in subtrees],
+        [[Point2(*p) for p in ring] for ring in contours],
+        [[Point2(*p) for p in ring] for ring in faces],
+    )
+
+
+CacheInfo = namedtuple("CacheInfo", "hits misses maxsize currsize")
+
+
+class SkeletonCache:
+    """
+    LRU cache of straight skeletons, keyed by the polygon up to translation and rotation.
+
+    Polygons are moved into a local frame, with the origin at the start of a canonical edge
+    and the x axis along it, and the local coordinates rounded to `precision` decimals form
+    the key. Skeletons are stored in the local frame and moved back to world space on lookup.
+    """
+
+    def __init__(self, maxsize=256, precision=6):
+        self.maxsize = maxsize
+        self.precision = precision
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def skeletonize(self, polygon, holes=None, zero_gradient=False, max_height=None, solve=None):
+        """
+        Same as skeletonize_faces, reusing the skeleton of any congruent polygon seen before.
+
+        Solve computes the skeleton on a miss, it takes the arguments of skeletonize_faces
+        and returns a Skeleton (defaults to skeletonize_faces). The faces of a cached
+        skeleton may start from a different edge than the polygon does.
+        """
+        holes = holes or []
+        origin, axis, local = self._local_frame(polygon)
+        local_holes = [[self._to_local(p, origin, axis) for p in hole] for hole in holes]
+        key = (
+            self._quantize(local),
+            tuple(self._quantize(hole) for hole in local_holes),
+            zero_gradient,
+            max_height,
+        )
+
+        result = self._get(key)
+        if result is None:
+            self.misses += 1
+            result = (solve or skeletonize_faces)(local, local_holes, zero_gradient, max_height)
+            self._put(key, result)
+        return self._result_to_world(result, origin, axis)
+
+    def skeletonize_many(
+        self, polygons, zero_gradient=False, max_height=None, workers=None, mp_context=None
+    ):
+        """
+        Same as skeletonize_many, solving each polygon missing from the cache once.
+
+        Congruent polygons in the batch share one skeleton, so only the distinct
+        shapes that were not cached before are sent to the worker processes.
+        """
+        frames = [self._local_frame(polygon) for polygon in polygons]
+        keys = [(self._quantize(local), (), zero_gradient, max_height) for _, _, local in frames]
+
+        results = {}
+        missing = {}
+        for key, (_, _, local) in zip(keys, frames):
+            if key in results or key in missing:
+                self.hits += 1
+                continue
+            result = self._get(key)
+            if result is None:
+                self.misses += 1
+                missing[key] = local
+            else:
+                results[key] = result
+
+        solved = skeletonize_many(
+            list(missing.values()), zero_gradient, max_height, workers, mp_context
+        )
+        for key, result in zip(missing, solved):
+            results[key] = result
+            self._put(key, result)
+
+        return [
+            self._result_to_world(results[key], origin, axis)
+            for key, (origin, axis, _) in zip(keys, frames)
+        ]
+
+    def cache_info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def cache_clear(self):
+        self.hits = self.misses = 0
+        self._data.clear()
+
+    def _get(self, key):
+        result = self._data.get(key)
+        if result is not None:
+            self.hits += 1
+            self._data.move_to_end(key)
+        return result
+
+    def _put(self, key, result):
+        self._data[key] = result
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def _quantize(self, points):
+        return tuple((round(x, self.precision), round(y, self.precision)) for x, y in points)
+
+    def _local_frame(self, polygon):
+        """Origin, unit x axis and local points for the canonical start edge of polygon
+
+        The start edge is the longest one, ties broken by the smallest key, so congruent
+        polygons get the same key whatever their position or first vertex.
+        """
+        polygon = [(float(x), float(y)) for x, y in polygon]
+        count = len(polygon)
+        lengths = [
+            round(math.hypot(bx - ax, by - ay), self.precision)
+            for (ax, ay), (bx, by) in zip(polygon, polygon[1:] + polygon[:1])
+        ]
+        longest = max(lengths)
+
+        best = None
+        for i in range(count):
+            if lengths[i] != longest:
+                continue
+            (ax, ay), (bx, by) = polygon[i], polygon[(i + 1) % count]
+            origin, axis = (ax, ay), normalized(bx - ax, by - ay)
+            local = [self._to_local(p, origin, axis) for p in polygon[i:] + polygon[:i]]
+            key = self._quantize(local)
+            if best is None or key < best[0]:
+                best = (key, origin, axis, local)
+        return best[1:]
+
+    @staticmethod
+    def _to_local(point, origin, axis):
+        x, y = point
+        dx, dy = x - origin[0], y - origin[1]
+        return (dx * axis[0] + dy * axis[1], dy * axis[0] - dx * axis[1])
+
+    @staticmethod
+    def _point_to_world(point, origin, axis):
+        x, y = point
+        return Point2(origin[0] + x * axis[0] - y * axis[1], origin[1] + x * axis[1] + y * axis[0])
+
+    def _result_to_world(self, result, origin, axis):
+        to_world = self._point_to_world
+        subtrees = [
+            Subtree(
+                to_world(arc.source, origin, axis),
+                arc.height,
+                [to_world(p, origin, axis) for p in arc.sinks],
+            )
+            for arc in result.subtrees
+        ]
+        contours, faces = (
+            [[to_world(p, origin, axis) for p in ring] for ring in rings]
+            for rings in (result.contours, result.faces)
+        )
+        return Skeleton(subtrees, contours, faces)
+
 
-    return output
+skeleton_cache = SkeletonCache()
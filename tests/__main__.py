@@ -14,6 +14,9 @@ try:
     import test_utils
     import test_floors
     import test_floorplan
+    import test_skeleton
+    import test_roof
+    import test_facemap
 except Exception:
     # XXX Error importing test modules.
     # Print Traceback and close blender process
@@ -36,6 +39,9 @@ def main():
     suite.addTests(loader.loadTestsFromModule(test_utils))
     suite.addTests(loader.loadTestsFromModule(test_floors))
     suite.addTests(loader.loadTestsFromModule(test_floorplan))
+    suite.addTests(loader.loadTestsFromModule(test_skeleton))
+    suite.addTests(loader.loadTestsFromModule(test_roof))
+    suite.addTests(loader.loadTestsFromModule(test_facemap))
 
     # initialize a runner, pass it your suite and run it
     runner = unittest.TextTestRunner(verbosity=3)
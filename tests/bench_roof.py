@@ -0,0 +1,86 @@
+"""Benchmarks for building hip roofs
+
+This needs blender, run it in the background with:
+
+    blender -b --python tests/bench_roof.py
+"""
+
+import os
+import sys
+import time
+
+import bpy
+import bmesh
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, tests_dir)
+sys.path.insert(0, os.path.dirname(tests_dir))
+
+import tools
+from bench_skeleton import stepped_footprint
+
+tools.LoadModule(os.path.join(os.path.dirname(tests_dir), "__init__.py"))
+
+from btools.utils import skeleton_cache, skeletonize_faces
+from btools.building.roof import RoofProperty
+from btools.building.roof.roof_ops import build as roof_builder
+
+
+def footprint_object(points):
+    """Object in edit mode with a single selected face on points"""
+    for obj in bpy.data.objects:
+        bpy.data.objects.remove(obj)
+
+    me = bpy.data.meshes.new("footprint")
+    bm = bmesh.new()
+    # -- the points are clockwise, the face has to point upwards
+    bm.faces.new([bm.verts.new((x, y, 0)) for x, y in reversed(points)])
+    bm.to_mesh(me)
+    bm.free()
+
+    obj = bpy.data.objects.new("footprint", me)
+    bpy.context.scene.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode="EDIT")
+    bpy.ops.mesh.select_all(action="SELECT")
+    return obj
+
+
+def bench_hip_roof(prop, sizes=(50, 100, 200, 400, 800)):
+    print("hip roof ({}) build time on stepped footprints".format(prop.hip_type.lower()))
+    print("{:>8} {:>12} {:>12} {:>12} {:>8}".format("verts", "build (s)", "skeleton (s)", "mesh (s)", "faces"))
+    max_height = prop.truncate if prop.hip_type == "TRUNCATED" else None
+    for size in sizes:
+        points = stepped_footprint(size)
+        start = time.perf_counter()
+        skeletonize_faces(points, max_height=max_height)
+        skeleton = time.perf_counter() - start
+
+        obj = footprint_object(points)
+        skeleton_cache.cache_clear()
+        start = time.perf_counter()
+        roof_builder(bpy.context, prop)
+        build = time.perf_counter() - start
+
+        bpy.ops.object.mode_set(mode="OBJECT")
+        faces = len(obj.data.polygons)
+        print("{:>8} {:>12.4f} {:>12.4f} {:>12.4f} {:>8}".format(len(points), build, skeleton, build - skeleton, faces))
+
+
+def main():
+    bpy.utils.register_class(RoofProperty)
+    bpy.types.Scene.roof_prop = bpy.props.PointerProperty(type=RoofProperty)
+    prop = bpy.context.scene.roof_prop
+    prop.type = "HIP"
+
+    for hip_type in ("FULL", "TRUNCATED"):
+        prop.hip_type = hip_type
+        bench_hip_roof(prop)
+        print()
+
+    del bpy.types.Scene.roof_prop
+    bpy.utils.unregister_class(RoofProperty)
+
+
+if __name__ == "__main__":
+    main()
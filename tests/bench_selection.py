@@ -0,0 +1,58 @@
+"""Benchmarks for grouping selected faces
+
+This needs blender, run it in the background with:
+
+    blender -b --python tests/bench_selection.py
+"""
+
+import os
+import sys
+import time
+import random
+
+import bmesh
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, tests_dir)
+sys.path.insert(0, os.path.dirname(tests_dir))
+
+import tools
+
+tools.LoadModule(os.path.join(os.path.dirname(tests_dir), "__init__.py"))
+
+from btools.utils import get_selection_groups
+
+
+def facade(bm, columns, rows, density, seed=0):
+    """Grid of columns x rows faces, with about density of them selected"""
+    rnd = random.Random(seed)
+    verts = [[bm.verts.new((x, 0, z)) for z in range(rows + 1)] for x in range(columns + 1)]
+    for x in range(columns):
+        for z in range(rows):
+            face = bm.faces.new((verts[x][z], verts[x + 1][z], verts[x + 1][z + 1], verts[x][z + 1]))
+            face.select = rnd.random() < density
+
+
+def bench_selection_groups(sizes=(10, 20, 40, 80, 160), density=0.6):
+    print("get_selection_groups on square facades, {:.0%} of faces selected".format(density))
+    print("{:>8} {:>10} {:>8} {:>12} {:>16}".format("faces", "selected", "groups", "time (s)", "us / face"))
+    for size in sizes:
+        bm = bmesh.new()
+        facade(bm, size, size, density)
+        selected = sum(f.select for f in bm.faces)
+
+        start = time.perf_counter()
+        groups = get_selection_groups(bm)
+        t = time.perf_counter() - start
+        print("{:>8} {:>10} {:>8} {:>12.4f} {:>16.2f}".format(len(bm.faces), selected, len(groups), t, t / selected * 1e6))
+        bm.free()
+
+
+def main():
+    bench_selection_groups()
+    print()
+    bench_selection_groups(density=1.0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Benchmarks for the straight skeleton
+
+util_skeleton has no bpy dependency, so this runs with a plain python interpreter:
+
+    python tests/bench_skeleton.py [revision]
+
+Given a git revision, e.g the commit before a change, the gable and memory benchmarks also run
+the util_skeleton of that revision on the same footprints, for comparison.
+"""
+
+import gc
+import os
+import sys
+import math
+import time
+import random
+import tempfile
+import subprocess
+import tracemalloc
+import importlib
+import importlib.util
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+skeleton_path = os.path.join(os.path.dirname(tests_dir), "btools", "utils", "util_skeleton.py")
+
+
+def load_skeleton():
+    """Import util_skeleton directly, without going through the (bpy dependent) btools package
+
+    It is imported by name so that the worker processes of skeletonize_many can import it too.
+    """
+    sys.path.insert(0, os.path.dirname(skeleton_path))
+    return importlib.import_module("util_skeleton")
+
+
+def load_revision(revision):
+    """Import util_skeleton as it was at a git revision"""
+    source = subprocess.check_output(
+        ["git", "show", "{}:btools/utils/util_skeleton.py".format(revision)],
+        cwd=os.path.dirname(tests_dir),
+    )
+    path = os.path.join(tempfile.mkdtemp(), "util_skeleton_{}.py".format(revision))
+    with open(path, "wb") as file:
+        file.write(source)
+    spec = importlib.util.spec_from_file_location("util_skeleton_{}".format(revision), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def stepped_footprint(count, seed=0):
+    """Rectilinear footprint with about count vertices, in the (clockwise) order used by roofs"""
+    rnd = random.Random(seed)
+    top = []
+    x = 0.0
+    for _ in range(max(2, count // 2 - 1)):
+        width, height = rnd.uniform(1, 3), rnd.uniform(2, 10)
+        top.extend([(x, height), (x + width, height)])
+        x += width
+    return top + [(x, 0.0), (0.0, 0.0)]
+
+
+def best_time(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+# -- largest ratio between the us / (n log n) of two sizes in bench_skeletonize
+N_LOG_N_SPREAD = 2.0
+
+
+def bench_skeletonize(skeleton, sizes=(100, 200, 400, 800, 1600)):
+    print("skeletonize (hip) on stepped footprints")
+    print("{:>8} {:>12} {:>16}".format("verts", "time (s)", "us / (n log n)"))
+    ratios = []
+    for size in sizes:
+        points = stepped_footprint(size)
+        n = len(points)
+        t = best_time(lambda: skeleton.skeletonize(points, []))
+        ratios.append(t / (n * math.log(n)) * 1e6)
+        print("{:>8} {:>12.4f} {:>16.2f}".format(n, t, ratios[-1]))
+    assert max(ratios) <= min(ratios) * N_LOG_N_SPREAD, "skeletonize does not scale as n log n"
+
+
+def bench_gable(skeleton, baseline=None, sizes=(50, 200, 1000)):
+    print("skeletonize (gable, zero_gradient=True) on stepped footprints")
+    print("{:>8} {:>12} {:>14} {:>12}".format("verts", "time (s)", "baseline (s)", "speedup"))
+    for size in sizes:
+        points = stepped_footprint(size)
+        t = best_time(lambda: skeleton.skeletonize(points, [], zero_gradient=True))
+        line = "{:>8} {:>12.4f}".format(len(points), t)
+        if baseline is not None:
+            base = best_time(lambda: baseline.skeletonize(points, [], zero_gradient=True))
+            line += " {:>14.4f} {:>12.2f}".format(base, base / t)
+        print(line)
+
+
+def peak_memory(func):
+    gc.collect()
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def event_blocks(skeleton, polygon):
+    """Memory blocks skeletonize allocates per event it handles
+
+    The blocks are counted from a tracemalloc snapshot diff taken with gc off, so the
+    vertices, events and edges the solver leaves for the cycle collector count too.
+    """
+    events = [0]
+
+    def counted(handle):
+        def wrapper(*args):
+            events[0] += 1
+            return handle(*args)
+
+        return wrapper
+
+    slav = skeleton.SLAV
+    handle_edge_event, handle_split_event = slav.handle_edge_event, slav.handle_split_event
+    slav.handle_edge_event, slav.handle_split_event = counted(handle_edge_event), counted(handle_split_event)
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = skeleton.skeletonize(polygon, [])
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+        slav.handle_edge_event, slav.handle_split_event = handle_edge_event, handle_split_event
+
+    own = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(own).compare_to(before.filter_traces(own), "filename")
+    del result
+    return sum(stat.count_diff for stat in stats) / events[0]
+
+
+def bench_memory(skeleton, baseline=None, sizes=(100, 400, 1600), seeds=3):
+    print("skeletonize (hip) traced memory on stepped footprints, mean of {} seeds".format(seeds))
+    columns = ["verts", "peak (KiB)", "bytes / vertex", "blocks / event"]
+    if baseline is not None:
+        columns += ["baseline (KiB)", "baseline blocks", "fewer blocks"]
+    print(" ".join("{:>16}".format(column) for column in columns))
+    for size in sizes:
+        polygons = [stepped_footprint(size, seed) for seed in range(seeds)]
+        peak = sum(peak_memory(lambda: skeleton.skeletonize(p, [])) for p in polygons) / seeds
+        blocks = sum(event_blocks(skeleton, p) for p in polygons) / seeds
+        values = [len(polygons[0]), peak / 1024, peak / len(polygons[0]), blocks]
+        if baseline is not None:
+            base = sum(peak_memory(lambda: baseline.skeletonize(p, [])) for p in polygons) / seeds
+            base_blocks = sum(event_blocks(baseline, p) for p in polygons) / seeds
+            values += [base / 1024, base_blocks, base_blocks / blocks]
+        print("{:>16}".format(values[0]) + "".join(" {:>16.1f}".format(value) for value in values[1:]))
+
+
+def bench_skeletonize_many(skeleton, count=64, size=200):
+    print("skeletonize_many on {} stepped footprints of {} vertices".format(count, size))
+    print("{:>8} {:>12} {:>12}".format("workers", "time (s)", "speedup"))
+    polygons = [stepped_footprint(size, seed) for seed in range(count)]
+    serial = None
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        t = best_time(lambda: skeleton.skeletonize_many(polygons, workers=workers), repeat=1)
+        serial = serial or t
+        print("{:>8} {:>12.4f} {:>12.2f}".format(workers, t, serial / t))
+
+
+def main():
+    skeleton = load_skeleton()
+    baseline = load_revision(sys.argv[1]) if len(sys.argv) > 1 else None
+    bench_skeletonize(skeleton)
+    print()
+    bench_gable(skeleton, baseline)
+    print()
+    bench_memory(skeleton, baseline)
+    print()
+    bench_skeletonize_many(skeleton)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import bmesh
+import unittest
+import warnings
+from unittest import mock
+
+from btools.utils import track_faces
+from btools.building import facemap
+from btools.building.facemap import FaceMap, map_new_faces, faces_created_since, find_faces_without_facemap
+
+
+class TestFacemap(unittest.TestCase):
+    def setUp(self):
+        self.bm = bmesh.new()
+        bmesh.ops.create_grid(self.bm, x_segments=4, y_segments=4, size=2)
+
+    def tearDown(self):
+        self.bm.free()
+
+    def test_faces_created_since(self):
+        stamp = self.bm.faces.layers.int.new("stamp")
+        for f in self.bm.faces:
+            f[stamp] = 1
+
+        existing = list(self.bm.faces)
+        snapshot = set(existing)
+        inset = bmesh.ops.inset_individual(self.bm, faces=existing[:1], thickness=0.1)["faces"]
+        fresh = self.bm.faces.new([self.bm.verts.new(co) for co in [(5, 5, 0), (6, 5, 0), (6, 6, 0)]])
+
+        created = faces_created_since(self.bm, snapshot)
+        self.assertEqual(set(created), set(inset) | {fresh})
+        self.assertFalse(set(created) & set(existing))
+
+        # -- faces derived from existing ones carry their layer values, so only identity marks them as new
+        self.assertEqual({f[stamp] for f in inset}, {1})
+        self.assertEqual(fresh[stamp], 0)
+
+    def test_find_faces_without_facemap(self):
+        face_map = self.bm.faces.layers.face_map.verify()
+        faces = list(self.bm.faces)
+        for index, f in enumerate(faces):
+            f[face_map] = 0 if index % 2 else -1
+        unmapped = faces[::2]
+
+        self.assertEqual(find_faces_without_facemap(self.bm), unmapped)
+        self.assertEqual(find_faces_without_facemap(self.bm, faces[:4]), unmapped[:2])
+
+    def test_audit_map_new_faces(self):
+        @map_new_faces(FaceMap.WALLS)
+        def build(bm, faces):
+            track_faces(bmesh.ops.inset_individual)(bm, faces=faces, thickness=0.1)
+            # -- not tracked, so only the audit finds it
+            return bm.faces.new([bm.verts.new(co) for co in [(5, 5, 0), (6, 5, 0), (6, 6, 0)]])
+
+        with mock.patch.object(facemap, "add_faces_to_map") as add_faces:
+            build(self.bm, list(self.bm.faces)[:2])
+            self.assertEqual(len(add_faces.call_args[0][1]), 8)
+
+            with mock.patch.object(facemap, "AUDIT_FACEMAPS", True), warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                fresh = build(self.bm, list(self.bm.faces)[:1])
+            self.assertEqual(len(caught), 1)
+            self.assertIn("build missed 1 faces", str(caught[0].message))
+            self.assertEqual(add_faces.call_args[0][1][-1], fresh)
+            self.assertEqual(len(add_faces.call_args[0][1]), 5)
@@ -1,8 +1,11 @@
 import bpy
+import bmesh
 import btools
 import random
 import unittest
 
+from mathutils import Matrix
+
 from btools.building.floor import FloorProperty
 from btools.building.floor.floor_ops import build as floor_builder
 
@@ -90,3 +93,22 @@ class TestFloor(unittest.TestCase):
                 floor_res = floor_builder(context, prop)
                 self.assertEqual(floor_res, {"FINISHED"})
                 self.assertEqual(len(bm.faces), (floorplan_edges_count * 4) + 1)
+
+    def test_flat_faces(self):
+        from btools.building.floor.floor_types import get_flat_faces
+
+        # -- a finely subdivided footprint, deeper than the recursion limit
+        bm = bmesh.new()
+        bmesh.ops.create_grid(bm, x_segments=120, y_segments=120, size=10)
+        faces = list(bm.faces)
+        self.assertEqual(set(get_flat_faces(faces[:1])), set(faces))
+
+        # -- faces across a fold are not flat
+        fold = [v for v in bm.verts if v.co.x > 0.001]
+        bmesh.ops.rotate(bm, verts=fold, cent=(0, 0, 0), matrix=Matrix.Rotation(0.5, 3, "Y"))
+        bm.normal_update()
+        flat = get_flat_faces(faces[:1])
+        self.assertEqual(flat[0], faces[0])
+        self.assertTrue(0 < len(flat) < len(faces))
+        self.assertEqual(set(get_flat_faces(flat)), set(flat))
+        bm.free()
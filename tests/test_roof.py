@@ -0,0 +1,106 @@
+import math
+import warnings
+import bmesh
+import unittest
+from unittest import mock
+
+from mathutils import Vector
+from mathutils.geometry import intersect_point_line
+
+from btools.utils import equal, util_skeleton
+from btools.building.roof.roof_types import RoofPoints, ring_sides, simplify_footprint
+
+from test_skeleton import radial_footprint, stepped_footprint
+
+
+def rotated(points, angle):
+    c, s = math.cos(angle), math.sin(angle)
+    return [(x * c - y * s, x * s + y * c) for x, y in points]
+
+
+def roof_rings(polygon, **options):
+    """Rings of location indices create_skeleton_faces would build the roof from"""
+    with warnings.catch_warnings():
+        # -- some rotated footprints give broken skeletons, their open faces are compared all the same
+        warnings.simplefilter("ignore", RuntimeWarning)
+        skeleton = util_skeleton.skeletonize_faces(polygon, [], **options)
+    points = RoofPoints([Vector((x, y, 0)) for x, y in polygon], lambda p: Vector((p.x, p.y, 1)))
+    rings = [points.ring(ring) for ring in skeleton.faces + skeleton.contours]
+    return points, [ring for ring in rings if len(ring) > 2]
+
+
+def index_full_scan(points, point):
+    """RoofPoints.index, looking at every location"""
+    for index, co in enumerate(points.locations):
+        if equal(co.x, point.x) and equal(co.y, point.y):
+            return index
+    points.locations.append(points.location(point))
+    return len(points.locations) - 1
+
+
+def split_sides_full_scan(points, rings, eps=0.001):
+    """RoofPoints.split_sides, testing every used location against every side"""
+    used = sorted({index for ring in rings for index in ring})
+    result = []
+    for ring in rings:
+        members = set(ring)
+        split = []
+        for a, b in ring_sides(ring):
+            split.append(a)
+            start, end = points.locations[a], points.locations[b]
+            between = []
+            for index in used:
+                if index in members:
+                    continue
+                co = points.locations[index]
+                point, factor = intersect_point_line(co, start, end)
+                if 0 < factor < 1 and (point - co).length <= eps:
+                    between.append((factor, index))
+                    members.add(index)
+            split.extend(index for _, index in sorted(between))
+        result.append(split)
+    return result
+
+
+class TestRoof(unittest.TestCase):
+    def footprints(self):
+        polygons = [stepped_footprint(count, seed) for count in (20, 60) for seed in range(3)]
+        polygons += [radial_footprint(count, seed) for count in (12, 30) for seed in range(3)]
+        for points in polygons:
+            for angle in (0, 0.3, 1.9):
+                for options in ({}, {"max_height": 1.0}):
+                    yield rotated(points, angle), options
+
+    def test_roof_points_match_full_scan(self):
+        for polygon, options in self.footprints():
+            points, rings = roof_rings(polygon, **options)
+            with mock.patch.object(RoofPoints, "index", index_full_scan):
+                expected_points, expected = roof_rings(polygon, **options)
+            self.assertEqual(rings, expected)
+            self.assertEqual(points.locations, expected_points.locations)
+
+    def test_split_sides_match_full_scan(self):
+        splits = 0
+        for polygon, options in self.footprints():
+            points, rings = roof_rings(polygon, **options)
+            split = points.split_sides(rings)
+            self.assertEqual(split, split_sides_full_scan(points, rings))
+            splits += sum(map(len, split)) - sum(map(len, rings))
+        # -- the corpus has points that split the sides of neighbouring faces
+        self.assertGreater(splits, 0)
+
+    def test_simplify_footprint(self):
+        bm = bmesh.new()
+        # -- the vert at (1, 2) is collinear with its neighbours
+        verts = [bm.verts.new(co) for co in [(0, 0, 0), (0, 2, 0), (1, 2, 0), (2, 2, 0), (2, 0, 0)]]
+        face = bm.faces.new(verts)
+        geom = bmesh.ops.extrude_face_region(bm, geom=[face])["geom"]
+        bmesh.ops.translate(bm, verts=[v for v in geom if isinstance(v, bmesh.types.BMVert)], vec=(0, 0, 1))
+        face = next(f for f in geom if isinstance(f, bmesh.types.BMFace))
+
+        self.assertEqual(simplify_footprint(bm, face, 0), 0)
+        self.assertEqual(len(face.verts), 5)
+
+        self.assertEqual(simplify_footprint(bm, face, 0.01), 1)
+        self.assertEqual(len(face.verts), 4)
+        bm.free()
@@ -0,0 +1,240 @@
+import hashlib
+import math
+import pickle
+import random
+import multiprocessing
+import warnings
+import unittest
+from unittest import mock
+
+from btools.utils import util_skeleton
+
+
+def stepped_footprint(count, seed=0):
+    """Rectilinear footprint with about count vertices, in clockwise order"""
+    rnd = random.Random(seed)
+    top = []
+    x = 0.0
+    for _ in range(max(2, count // 2 - 1)):
+        width, height = rnd.uniform(1, 3), rnd.uniform(2, 10)
+        top.extend([(x, height), (x + width, height)])
+        x += width
+    return top + [(x, 0.0), (0.0, 0.0)]
+
+
+def radial_footprint(count, seed=0):
+    """Star shaped footprint with count vertices, in clockwise order"""
+    rnd = random.Random(seed)
+    angles = [-2 * math.pi * i / count for i in range(count)]
+    return [(r * math.cos(a), r * math.sin(a)) for a, r in ((a, rnd.uniform(5, 10)) for a in angles)]
+
+
+class TestSkeleton(unittest.TestCase):
+    def test_square(self):
+        skeleton = util_skeleton.skeletonize([(0, 0), (0, 2), (2, 2), (2, 0)], [])
+        sources = {(round(arc.source.x, 3), round(arc.source.y, 3)) for arc in skeleton}
+        self.assertEqual(sources, {(1.0, 1.0)})
+        self.assertAlmostEqual(max(arc.height for arc in skeleton), 1.0)
+
+    def test_split_candidates_match_full_scan(self):
+        def all_edges(grid, point):
+            yield 0.0, sorted({index for cell in grid.cells.values() for index in cell})
+
+        def rotated(points, angle):
+            c, s = math.cos(angle), math.sin(angle)
+            return [(x * c - y * s, x * s + y * c) for x, y in points]
+
+        def arcs(points):
+            return [
+                (arc.source.x, arc.source.y, arc.height, [(p.x, p.y) for p in arc.sinks])
+                for arc in util_skeleton.skeletonize(points, [])
+            ]
+
+        polygons = [stepped_footprint(count, seed) for count in (20, 60) for seed in range(3)]
+        polygons += [radial_footprint(count, seed) for count in (12, 30) for seed in range(3)]
+        polygons += [[(0, 0), (0, 4), (9, 4), (9, 0)]]
+        for points in polygons:
+            for angle in (0, 0.3, 1.9):
+                polygon = rotated(points, angle)
+                with mock.patch.object(util_skeleton.EdgeGrid, "rings", all_edges):
+                    expected = arcs(polygon)
+                self.assertEqual(arcs(polygon), expected)
+
+    def test_edge_vertex_index(self):
+        slav = util_skeleton.SLAV(stepped_footprint(20), [])
+        lav = next(iter(slav))
+        for vertex in lav:
+            self.assertIs(vertex.edge_left, vertex.prev.edge_right)
+            self.assertEqual(set(slav._edge_vertices[vertex.edge_left]), {vertex, vertex.prev})
+
+        a = lav.head
+        b = a.next
+        lav.unify(a, b, a.point)
+        self.assertFalse(a in slav._edge_vertices[a.edge_left])
+        self.assertFalse(b in slav._edge_vertices[b.edge_right])
+
+    def test_split_event_lav_order(self):
+        # -- split events with several candidate vertices take the first in lav order, as before the edge index
+        baseline = {
+            (120, 0): (120, "271ddbfbbb35dac5e8a83cbf54c2940d99d5a0cf"),
+            (80, 3): (80, "d683f8da45b20fc1510b141ffcf811b4086de114"),
+        }
+        for (count, seed), (length, digest) in baseline.items():
+            arcs = [
+                (
+                    round(arc.source.x, 6),
+                    round(arc.source.y, 6),
+                    round(arc.height, 6),
+                    [(round(p.x, 6), round(p.y, 6)) for p in arc.sinks],
+                )
+                for arc in util_skeleton.skeletonize(radial_footprint(count, seed), [])
+            ]
+            self.assertEqual(len(arcs), length)
+            self.assertEqual(hashlib.sha1(repr(arcs).encode()).hexdigest(), digest)
+
+    def test_max_height(self):
+        rect = [(0, 0), (0, 4), (10, 4), (10, 0)]
+        skeleton, contours = util_skeleton.skeletonize(rect, [], max_height=1)
+        self.assertEqual(len(contours), 1)
+        self.assertEqual(
+            [(round(p.x, 3), round(p.y, 3)) for p in contours[0]],
+            [(1.0, 1.0), (1.0, 3.0), (9.0, 3.0), (9.0, 1.0)],
+        )
+        self.assertTrue(all(arc.height == 1 for arc in skeleton))
+
+        # -- skeleton finishes below max_height
+        skeleton, contours = util_skeleton.skeletonize(rect, [], max_height=5)
+        self.assertEqual(contours, [])
+        self.assertEqual(len(skeleton), len(util_skeleton.skeletonize(rect, [])))
+
+        # -- holes can be left out
+        self.assertEqual(util_skeleton.skeletonize(rect, max_height=1), util_skeleton.skeletonize(rect, [], max_height=1))
+        self.assertEqual(
+            util_skeleton.skeletonize_faces(rect, max_height=1),
+            util_skeleton.skeletonize_faces(rect, [], max_height=1),
+        )
+
+    def test_iter_skeleton(self):
+        points = stepped_footprint(40, seed=3)
+        skeleton = util_skeleton.skeletonize(points, [])
+        self.assertEqual(list(util_skeleton.iter_skeleton(points, [])), skeleton)
+
+        # -- stopping early keeps a prefix of the full skeleton
+        subtrees = util_skeleton.iter_skeleton(points, [])
+        first = [next(subtrees) for _ in range(5)]
+        self.assertEqual(first, skeleton[:5])
+
+        # -- faces are only collected when asked for
+        for options, collected in (({}, False), ({"faces": True}, True)):
+            subtrees = util_skeleton.iter_skeleton(points, [], **options)
+            with self.assertRaises(StopIteration) as stop:
+                while True:
+                    next(subtrees)
+            self.assertEqual(stop.exception.value[1] is not None, collected)
+
+    def test_skeleton_cache(self):
+        def moved(points, angle, offset, shift):
+            c, s = math.cos(angle), math.sin(angle)
+            points = [(x * c - y * s + offset, x * s + y * c - offset) for x, y in points]
+            return points[shift:] + points[:shift]
+
+        def sources(skeleton):
+            return sorted((round(arc.source.x, 6), round(arc.source.y, 6)) for arc in skeleton)
+
+        cache = util_skeleton.SkeletonCache(maxsize=2)
+        points = [(0, 0), (1, 3), (4, 4), (6, 1), (3, -1)]
+        for angle, offset, shift in [(0, 0, 0), (0.7, 5, 2), (2.1, -3, 4)]:
+            polygon = moved(points, angle, offset, shift)
+            self.assertEqual(
+                sources(cache.skeletonize(polygon, []).subtrees),
+                sources(util_skeleton.skeletonize(polygon, [])),
+            )
+        self.assertEqual(cache.cache_info(), (2, 1, 2, 1))
+
+        # -- least recently used entries are evicted
+        cache.skeletonize(moved(points, 0, 0, 0), [], zero_gradient=True)
+        cache.skeletonize(moved(points, 0, 0, 0), [], max_height=0.5)
+        cache.skeletonize(points, [])
+        self.assertEqual(cache.cache_info(), (2, 4, 2, 2))
+
+    def test_skeletonize_many(self):
+        polygons = [stepped_footprint(20, seed) for seed in range(3)]
+        expected = [util_skeleton.skeletonize_faces(p, []) for p in polygons]
+        self.assertEqual(util_skeleton.skeletonize_many(polygons, workers=1), expected)
+
+        # -- spawned workers only import util_skeleton, they must not fail and leave the polygons to this process
+        spawn = multiprocessing.get_context("spawn")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.assertEqual(util_skeleton.skeletonize_many(polygons, workers=2, mp_context=spawn), expected)
+        self.assertEqual(caught, [])
+
+        # -- and unpickle the function they run without importing btools, which imports bpy
+        solve = pickle.dumps(util_skeleton._standalone_module()._solve_plain)
+        self.assertNotIn(b"btools", solve)
+
+        # -- the cache solves congruent polygons once
+        cache = util_skeleton.SkeletonCache()
+        moved = [[(x + 10, y) for x, y in p] for p in polygons]
+        results = cache.skeletonize_many(polygons + moved, workers=1)
+        self.assertEqual(cache.cache_info()[:2], (3, 3))
+        self.assertEqual(len(results), 6)
+
+    def test_skeleton_faces(self):
+        def area(ring):
+            return sum(a.x * b.y - b.x * a.y for a, b in zip(ring, ring[1:] + ring[:1])) / 2
+
+        points = stepped_footprint(30, seed=2)
+        polygon_area = area([util_skeleton.Point2(x, y) for x, y in points])
+        for options in ({}, {"zero_gradient": True}, {"max_height": 1.0}):
+            skeleton = util_skeleton.skeletonize_faces(points, [], **options)
+            self.assertEqual(len(skeleton.faces), len(points))
+
+            # -- the faces (and flat top) tile the footprint
+            covered = sum(map(area, skeleton.faces)) + sum(map(area, skeleton.contours))
+            self.assertAlmostEqual(covered, polygon_area)
+
+        for ring, start, end in zip(skeleton.faces, points[-1:] + points[:-1], points):
+            self.assertEqual((ring[0].x, ring[0].y, ring[1].x, ring[1].y), start + end)
+
+    def test_skeleton_faces_rotated(self):
+        def area(ring):
+            return sum(a.x * b.y - b.x * a.y for a, b in zip(ring, ring[1:] + ring[:1])) / 2
+
+        def rotated(points, angle):
+            c, s = math.cos(angle), math.sin(angle)
+            return [util_skeleton.Point2(x * c - y * s, x * s + y * c) for x, y in points]
+
+        l_shape = [(0, 0), (0, 6), (3, 6), (3, 3), (8, 3), (8, 0)]
+        t_shape = [(0, 0), (0, 2), (-3, 2), (-3, 5), (6, 5), (6, 2), (3, 2), (3, 0)]
+        for points in (l_shape, t_shape):
+            for angle in (0.3, 1.1, 2.5, 4.0):
+                polygon = rotated(points, angle)
+                for options in ({}, {"zero_gradient": True}, {"max_height": 1.0}):
+                    with warnings.catch_warnings(record=True) as caught:
+                        warnings.simplefilter("always")
+                        skeleton = util_skeleton.skeletonize_faces(polygon, [], **options)
+                    self.assertEqual(caught, [])
+
+                    # -- every face ring is closed and none overlap, so together they cover the footprint
+                    covered = sum(map(area, skeleton.faces)) + sum(map(area, skeleton.contours))
+                    self.assertAlmostEqual(covered, area(polygon))
+
+    def test_open_face_ring(self):
+        P = util_skeleton.Point2
+        start, end = P(0, 0), P(4, 0)
+        closed = [(P(4, 0), P(3, 1)), (P(1, 1), P(0, 0)), (P(3, 1), P(1, 1))]
+        self.assertEqual(util_skeleton._face_ring(start, end, closed), [start, end, P(3, 1), P(1, 1)])
+
+        # -- a gap in the chain leaves the face open instead of jumping to the nearest segment
+        with self.assertWarns(RuntimeWarning):
+            ring = util_skeleton._face_ring(start, end, [closed[0], (P(1.5, 1), P(0, 0))])
+        self.assertEqual(ring, [start, end])
+
+    def test_simplify_polygon(self):
+        points = [(0, 0), (0, 1), (0, 2), (0.001, 2.0005), (2, 2), (2, 1.0004), (2, 0), (1, 0.0003)]
+        self.assertEqual(util_skeleton.simplify_polygon(points, 0.01), [0, 2, 4, 6])
+        self.assertEqual(util_skeleton.simplify_polygon(points, 0), list(range(len(points))))
+
+        # -- never fewer than three vertices
+        self.assertEqual(len(util_skeleton.simplify_polygon(points, 100)), len(points))
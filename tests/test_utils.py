@@ -328,6 +328,118 @@ class TestUtilsMesh(unittest.TestCase):
         btools.utils.cube(self.bm)
         self.assertEqual(btools.utils.calc_faces_median(self.bm.faces), Vector())
 
+    def test_closest_faces(self):
+        btools.utils.cube(self.bm)
+        faces = list(self.bm.faces)
+        locations = [f.calc_center_bounds() for f in reversed(faces)]
+        self.assertEqual(btools.utils.closest_faces(faces, locations), faces[::-1])
+        self.assertEqual(btools.utils.closest_faces(faces, [Vector((0, 0, 5))]), [None])
+
+        for f in faces:
+            self.assertIs(btools.utils.face_with_verts(self.bm, reversed(f.verts)), f)
+        self.assertIsNone(btools.utils.face_with_verts(self.bm, list(faces[0].verts)[:3]))
+
+    def test_collect_new_faces(self):
+        bmesh.ops.create_grid(self.bm, x_segments=6, y_segments=6, size=3)
+        track = btools.utils.track_faces
+        faces = list(self.bm.faces)
+        snapshot = set(faces)
+
+        with btools.utils.collect_new_faces() as created:
+            track(bmesh.ops.inset_individual)(self.bm, faces=faces[:2], thickness=0.1)
+            with btools.utils.collect_new_faces() as inner:
+                geom = track(bmesh.ops.extrude_face_region)(self.bm, geom=faces[10:12])["geom"]
+            track(bmesh.ops.dissolve_faces)(self.bm, faces=faces[20:23])
+            track(bmesh.ops.subdivide_edges)(self.bm, edges=list(faces[30].edges), cuts=2)
+            track(bmesh.ops.dissolve_verts)(self.bm, verts=list(faces[33].verts)[:1])
+            bmesh.ops.delete(self.bm, geom=faces[5:7], context="FACES_ONLY")
+            verts = [self.bm.verts.new(co) for co in [(5, 5, 0), (6, 5, 0), (6, 6, 0)]]
+            btools.utils.log_new_faces([self.bm.faces.new(verts)])
+
+        expected = [f for f in self.bm.faces if f not in snapshot]
+        self.assertEqual(set(btools.utils.validate(created)), set(expected))
+        self.assertTrue(set(btools.utils.filter_geom(geom, bmesh.types.BMFace)) <= set(inner))
+
+        # -- ops outside of collect_new_faces are left alone
+        self.assertEqual(btools.utils.new_face_logs, [])
+        self.assertIn("faces", track(bmesh.ops.inset_individual)(self.bm, faces=expected[:1]))
+
+    def test_remove_doubles_around(self):
+        btools.utils.plane(self.bm)
+        v0, v1, v2, v3 = list(next(iter(self.bm.faces)).verts)
+
+        # -- verts of a new face are welded to the verts linked to them, the rest of the mesh is left alone
+        far = [self.bm.verts.new((10, 0, 0)) for _ in range(2)]
+        face = self.bm.faces.new((v0, v1, self.bm.verts.new(v2.co)))
+        btools.utils.remove_doubles_around(self.bm, face.verts)
+        self.assertEqual(len(self.bm.verts), 6)
+        self.assertIn(v2, face.verts)
+
+        btools.utils.remove_doubles_around(self.bm, far[:1])
+        self.assertEqual(len(self.bm.verts), 6)
+        btools.utils.remove_doubles_around(self.bm, far)
+        self.assertEqual(len(self.bm.verts), 5)
+
+    def test_subdivide_face(self):
+        verts = [self.bm.verts.new(co) for co in [(0, 0, 0), (4, 0, 0), (4, 0, 2), (0, 0, 2)]]
+        face = self.bm.faces.new(verts)
+        face.normal_update()
+
+        faces = btools.utils.subdivide_face_horizontally(self.bm, face, widths=[1, 2.5, 0.5])
+        self.assertEqual([btools.utils.calc_face_dimensions(f) for f in faces], [(1, 2), (2.5, 2), (0.5, 2)])
+
+        faces = btools.utils.subdivide_face_vertically(self.bm, faces[1], widths=[0.5, 1.5])
+        self.assertEqual([btools.utils.calc_face_dimensions(f) for f in faces], [(2.5, 0.5), (2.5, 1.5)])
+
+    def test_face_analysis(self):
+        btools.utils.cube(self.bm)
+        faces = list(self.bm.faces)
+        analysis = btools.utils.analyze_faces(faces)
+        for f, a in zip(faces, analysis):
+            self.assertEqual([v.to_tuple(3) for v in (a.x, a.y, a.z)], [v.to_tuple(3) for v in btools.utils.local_xyz(f)])
+            self.assertTrue(a.is_rectangle)
+        self.assertEqual(sorted(a[:2] for a in analysis), [(2, 2)] * 6)
+
+        cache = btools.utils.face_analysis_cache
+        cache.cache_clear()
+
+        # -- single faces outside of a build are measured directly, without the cache
+        self.assertEqual([btools.utils.calc_face_dimensions(f) for f in faces], [a[:2] for a in analysis])
+        self.assertTrue(all(btools.utils.is_rectangle(f) for f in faces))
+        self.assertEqual(cache.cache_info(), (0, 0, 0))
+
+        @btools.utils.cache_face_analysis
+        def build():
+            btools.utils.analyze_faces(faces)
+            btools.utils.calc_face_dimensions(faces[0])
+            self.assertEqual(cache.cache_info(), (1, 6, 6))
+
+            # -- moved faces are analyzed again
+            bmesh.ops.translate(self.bm, verts=faces[0].verts, vec=(0, 0, 1))
+            btools.utils.analyze_faces(faces)
+            self.assertEqual(cache.cache_info().misses, 6 + 5)
+
+        build()
+        self.assertEqual(cache.cache_info(), (2, 11, 0))
+
+    def test_selection_groups(self):
+        verts = [[self.bm.verts.new((x, y, 0)) for y in range(5)] for x in range(5)]
+        faces = [
+            self.bm.faces.new((verts[x][y], verts[x + 1][y], verts[x + 1][y + 1], verts[x][y + 1]))
+            for x in range(4)
+            for y in range(4)
+        ]
+        self.assertEqual(btools.utils.get_selection_groups(self.bm), [])
+
+        # -- a column, half a column, and a face touching that half only at a corner
+        selected = faces[:4] + faces[8:10] + faces[14:15]
+        for f in selected:
+            f.select = True
+
+        groups = btools.utils.get_selection_groups(self.bm)
+        self.assertEqual([len(g) for g in groups], [4, 2, 1])
+        self.assertEqual(groups, [faces[:4], faces[8:10], faces[14:15]])
+
 
 class TestUtilsEvent(unittest.TestCase):
 